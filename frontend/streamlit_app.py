@@ -15,7 +15,7 @@ import streamlit as st
 # Import humancheck - works both in development and when installed
 from humancheck.core.config.settings import get_config, init_config
 from humancheck.core.storage.database import init_db
-from humancheck.core.models import Attachment, Decision, DecisionType, Review, ReviewStatus
+from humancheck.core.models import Decision, DecisionType, Review, ReviewStatus
 from humancheck.dashboard.preview import render_preview_panel
 
 
@@ -62,11 +62,21 @@ def run_async(coro):
 
 
 async def get_reviews(status_filter=None, task_type_filter=None):
-    """Get reviews from database."""
+    """Get reviews from database, with their decisions and attachments.
+
+    Decisions are joined in and attachments (including their deferred content and
+    metadata, which the preview panel renders) come back in one extra IN query,
+    instead of one query per review for each.
+    """
     async with db.session() as session:
         from sqlalchemy import select
+        from sqlalchemy.orm import selectinload
 
-        query = select(Review).order_by(Review.created_at.desc())
+        query = (
+            select(Review)
+            .options(selectinload(Review.attachments).undefer_group("large"))
+            .order_by(Review.created_at.desc())
+        )
 
         if status_filter and status_filter != "All":
             query = query.where(Review.status == status_filter.lower())
@@ -75,50 +85,23 @@ async def get_reviews(status_filter=None, task_type_filter=None):
             query = query.where(Review.task_type == task_type_filter)
 
         result = await session.execute(query)
-        reviews = list(result.scalars().all())
+        reviews = list(result.unique().scalars().all())
 
-        # Detach from session to avoid lazy loading issues
-        for review in reviews:
-            session.expunge(review)
+        # Detach everything loaded (reviews, decisions, attachments) in one sweep
+        session.expunge_all()
 
         return reviews
 
 
-async def get_review_with_decision(review_id):
-    """Get review with its decision."""
+async def get_task_types():
+    """Get the distinct task types across all reviews, sorted."""
     async with db.session() as session:
-        from sqlalchemy.orm import selectinload
         from sqlalchemy import select
 
-        # Eagerly load the decision relationship
-        query = select(Review).where(Review.id == review_id).options(selectinload(Review.decision))
-        result = await session.execute(query)
-        review = result.scalar_one_or_none()
-
-        if review:
-            # Access decision before expunging to ensure it's loaded
-            decision = review.decision
-            session.expunge(review)
-            # Only expunge decision if it's actually in the session
-            if decision and decision in session:
-                session.expunge(decision)
-        return review
-
-
-async def get_attachments(review_id):
-    """Get attachments for a review."""
-    async with db.session() as session:
-        from sqlalchemy import select
-
-        query = select(Attachment).where(Attachment.review_id == review_id).order_by(Attachment.uploaded_at.desc())
-        result = await session.execute(query)
-        attachments = list(result.scalars().all())
-
-        # Detach from session
-        for attachment in attachments:
-            session.expunge(attachment)
-
-        return attachments
+        result = await session.execute(
+            select(Review.task_type).where(Review.task_type.isnot(None)).distinct()
+        )
+        return sorted(task_type for task_type in result.scalars().all() if task_type)
 
 
 async def create_decision(review_id, decision_type, modified_action=None, notes=None, reviewer_id=None):
@@ -247,8 +230,7 @@ status_filter = st.sidebar.selectbox(
 )
 
 # Get unique task types
-reviews_for_filter = run_async(get_reviews())
-task_types = ["All"] + sorted(list(set(r.task_type for r in reviews_for_filter if r.task_type)))
+task_types = ["All"] + run_async(get_task_types())
 task_type_filter = st.sidebar.selectbox("Task Type", task_types)
 
 # Auto-refresh
@@ -301,8 +283,10 @@ else:
                     st.markdown("**Agent Reasoning:**")
                     st.write(review.agent_reasoning)
 
-                # Show attachments if any
-                attachments = run_async(get_attachments(review.id))
+                # Show attachments if any (newest first)
+                attachments = sorted(
+                    review.attachments, key=lambda attachment: attachment.uploaded_at, reverse=True
+                )
                 if attachments:
                     st.divider()
                     st.markdown(f"**Attachments ({len(attachments)}):**")
@@ -533,12 +517,11 @@ agent.invoke(
 
             # Show decision for completed reviews
             elif review.status != ReviewStatus.PENDING.value:
-                review_with_decision = run_async(get_review_with_decision(review.id))
-                if review_with_decision and review_with_decision.decision:
+                if review.decision:
                     st.divider()
                     st.markdown("### Decision")
 
-                    decision = review_with_decision.decision
+                    decision = review.decision
 
                     if decision.decision_type == DecisionType.APPROVE.value:
                         st.success(f"✅ Approved")
@@ -9,6 +9,10 @@ from ..core.config.settings import get_config
 from ..core.storage.database import init_db
 from ..core.adapters import RestAdapter, register_adapter
 from ..core.file_storage import get_storage_manager
+from ..core.integrations import close_connectors
+from ..core.integrations.slack import close_shared_session
+from ..core.routing import RoutingEngine
+from ..core.security.content_validator import checksum_backend
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +35,18 @@ async def lifespan(app: FastAPI):
     # Initialize storage
     storage_manager = get_storage_manager()
     storage_manager.initialize(provider_type="local", base_path="./storage")
+    if checksum_backend() != "openssl":
+        logger.warning(
+            "hashlib is not OpenSSL-backed; attachment checksums will not use "
+            "hardware SHA acceleration"
+        )
+
+    # Compile routing rules now so the first review doesn't pay for it. A failure here
+    # only loses the head start; routing compiles the rules again on first use.
+    try:
+        RoutingEngine().warmup()
+    except Exception as e:
+        logger.warning(f"Routing rule warm-up failed: {e}", exc_info=True)
 
     # Store in app state for access in routes
     app.state.db = db
@@ -41,6 +57,8 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    await close_connectors()
+    await close_shared_session()
     await db.close()
     logger.info("Humancheck API stopped")
 
@@ -1,5 +1,4 @@
 """Attachment endpoints"""
-import io
 import logging
 from typing import Optional
 from uuid import uuid4
@@ -8,10 +7,11 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from ...core.models.review import Review
 from ...core.models.attachment import Attachment, ContentCategory
-from ...core.security import validate_file
+from ...core.security import validate_file_async
 from ...core.security.content_validator import sanitize_filename
 from ...core.file_storage import get_storage_manager
 from ..dependencies import get_session
@@ -53,16 +53,12 @@ async def upload_attachment(
         if not review:
             raise HTTPException(status_code=404, detail=f"Review {review_id} not found")
 
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
-
         # Detect content category
         content_category = _detect_content_category(file.content_type or "application/octet-stream")
 
-        # Validate file
-        is_valid, error, validation_metadata = validate_file(
-            content,
+        # Validate file in a single streaming pass (no full read into memory)
+        is_valid, error, validation_metadata = await validate_file_async(
+            file.file,
             file.content_type or "application/octet-stream",
             content_category
         )
@@ -70,6 +66,8 @@ async def upload_attachment(
         if not is_valid:
             raise HTTPException(status_code=400, detail=f"File validation failed: {error}")
 
+        file_size = validation_metadata["validated_size"]
+
         # Get checksum from validation metadata
         checksum = validation_metadata.get("checksum")
 
@@ -79,23 +77,24 @@ async def upload_attachment(
         # Generate storage key
         storage_key = f"reviews/{review_id}/attachments/{uuid4()}/{safe_filename}"
 
-        # Upload to storage
+        # Upload to storage (the spooled upload file avoids another in-memory copy)
         storage = get_storage_manager().get()
+        await file.seek(0)
         await storage.upload(
-            file=io.BytesIO(content),
+            file=file.file,
             key=storage_key,
             content_type=file.content_type or "application/octet-stream",
             metadata={"review_id": review_id, "file_name": safe_filename},
         )
 
         # Get URLs
-        preview_url = await storage.get_url(storage_key, expires_in=3600, download=False)
-        download_url = await storage.get_url(storage_key, expires_in=3600, download=True)
+        preview_url, download_url = await storage.get_urls(storage_key, expires_in=3600)
 
         # For text files, store inline content
         inline_content = None
         if content_category == ContentCategory.TEXT.value and file_size < 1024 * 1024:  # < 1MB
-            inline_content = content.decode("utf-8", errors="replace")
+            await file.seek(0)
+            inline_content = (await file.read()).decode("utf-8", errors="replace")
 
         # Create attachment record
         attachment = Attachment(
@@ -120,10 +119,17 @@ async def upload_attachment(
         )
 
         session.add(attachment)
+        await session.flush()
+        attachment_id = attachment.id
         await session.commit()
-        await session.refresh(attachment)
 
-        return attachment
+        # Reload with the deferred columns so the response includes them
+        result = await session.execute(
+            select(Attachment)
+            .options(undefer_group("large"))
+            .where(Attachment.id == attachment_id)
+        )
+        return result.scalar_one()
 
     except HTTPException:
         raise
@@ -150,6 +156,7 @@ async def list_attachments(
         # Get attachments
         result = await session.execute(
             select(Attachment)
+            .options(undefer_group("large"))
             .where(Attachment.review_id == review_id)
             .order_by(Attachment.uploaded_at.desc())
         )
@@ -171,7 +178,11 @@ async def get_attachment(
 ):
     """Get attachment metadata."""
     try:
-        result = await session.execute(select(Attachment).where(Attachment.id == attachment_id))
+        result = await session.execute(
+            select(Attachment)
+            .options(undefer_group("large"))
+            .where(Attachment.id == attachment_id)
+        )
         attachment = result.scalar_one_or_none()
 
         if not attachment:
@@ -200,17 +211,17 @@ async def download_attachment(
         if not attachment:
             raise HTTPException(status_code=404, detail=f"Attachment {attachment_id} not found")
 
-        # Download from storage
+        # Stream from storage without loading the whole file into memory
         storage = get_storage_manager().get()
-        content = await storage.download(attachment.storage_key)
+        if not await storage.exists(attachment.storage_key):
+            raise FileNotFoundError(f"File not found: {attachment.storage_key}")
 
-        # Return as streaming response
         return StreamingResponse(
-            io.BytesIO(content),
+            storage.stream(attachment.storage_key),
             media_type=attachment.content_type,
             headers={
                 "Content-Disposition": f'{disposition}; filename="{attachment.file_name}"',
-                "Content-Length": str(len(content)),
+                "Content-Length": str(attachment.file_size),
             },
         )
 
@@ -5,6 +5,7 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.adapters.decision_events import notify_decision
 from ...core.models.review import Review, ReviewStatus
 from ...core.models.decision import Decision, DecisionType
 from ...core.schemas.decision import DecisionCreate, DecisionResponse
@@ -31,20 +32,22 @@ async def create_decision(
         if not review:
             raise HTTPException(status_code=404, detail="Review not found")
 
-        # Check if decision already exists
-        existing_decision = await session.get(Decision, review_id)
-        if existing_decision:
+        # Check if decision already exists (it's joined in with the review)
+        if review.decision is not None:
             raise HTTPException(
                 status_code=409,
                 detail="Decision already exists for this review"
             )
 
+        # The schema stores enum values (use_enum_values), so decision_type is a str
+        decision_type = DecisionType(decision_data.decision_type)
+
         # Create decision
         decision = Decision(
             review_id=review_id,
             reviewer_id=decision_data.reviewer_id,
             reviewer_name=decision_data.reviewer_name,
-            decision_type=decision_data.decision_type.value,
+            decision_type=decision_type.value,
             modified_action=decision_data.modified_action,
             notes=decision_data.notes,
         )
@@ -52,16 +55,19 @@ async def create_decision(
         session.add(decision)
 
         # Update review status
-        if decision_data.decision_type == DecisionType.APPROVE:
+        if decision_type == DecisionType.APPROVE:
             review.status = ReviewStatus.APPROVED.value
-        elif decision_data.decision_type == DecisionType.REJECT:
+        elif decision_type == DecisionType.REJECT:
             review.status = ReviewStatus.REJECTED.value
-        elif decision_data.decision_type == DecisionType.MODIFY:
+        elif decision_type == DecisionType.MODIFY:
             review.status = ReviewStatus.MODIFIED.value
 
         await session.commit()
         await session.refresh(decision)
 
+        # Wake blocking requests for this review that are waiting in this process
+        notify_decision(review_id)
+
         return decision
 
     except HTTPException:
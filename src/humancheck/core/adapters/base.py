@@ -5,8 +5,10 @@ from typing import Any, Optional
 
 from ..models import UrgencyLevel
 
+_URGENCY_BY_VALUE = {level.value: level for level in UrgencyLevel}
 
-@dataclass
+
+@dataclass(slots=True)
 class UniversalReview:
     """Universal review format that normalizes all review requests.
 
@@ -24,6 +26,31 @@ class UniversalReview:
     agent_id: Optional[int] = None
     blocking: bool = False
 
+    @classmethod
+    def from_review(cls, review: Any) -> "UniversalReview":
+        """Build a UniversalReview from a stored Review.
+
+        Reviews have no organization/agent columns; those IDs are read from the metadata.
+
+        Args:
+            review: Review model instance
+
+        Returns:
+            UniversalReview instance
+        """
+        metadata = review.meta_data or {}
+        return cls(
+            task_type=review.task_type,
+            proposed_action=review.proposed_action,
+            agent_reasoning=review.agent_reasoning,
+            confidence_score=review.confidence_score,
+            urgency=_URGENCY_BY_VALUE[review.urgency],
+            framework=review.framework,
+            metadata=review.meta_data,
+            organization_id=metadata.get("organization_id"),
+            agent_id=metadata.get("agent_id"),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
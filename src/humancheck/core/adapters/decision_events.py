@@ -0,0 +1,64 @@
+"""In-process signalling of decisions to blocking review requests.
+
+Blocking adapters poll the database for a decision. When the decision is made in the
+same process (e.g. a REST decision while a REST request blocks), notify_decision()
+wakes the waiters immediately instead of leaving them to the next poll. Decisions
+made in another process are still picked up by polling.
+"""
+import asyncio
+from typing import Callable
+
+# review_id -> event set when a decision for that review is made
+_events: dict[int, asyncio.Event] = {}
+_waiter_counts: dict[int, int] = {}
+# Called with the review ID on every decision (e.g. to drop cached responses)
+_listeners: list[Callable[[int], None]] = []
+
+
+def add_decision_listener(listener: Callable[[int], None]) -> None:
+    """Register a callback to run, with the review ID, whenever a decision is made.
+
+    Args:
+        listener: Callback taking the decided review's ID
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+async def wait_for_decision(review_id: int, timeout: float) -> bool:
+    """Wait until a decision for a review is signalled in this process.
+
+    Args:
+        review_id: ID of the review to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if a decision was signalled, False if the timeout elapsed first
+    """
+    event = _events.setdefault(review_id, asyncio.Event())
+    _waiter_counts[review_id] = _waiter_counts.get(review_id, 0) + 1
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return event.is_set()
+    finally:
+        _waiter_counts[review_id] -= 1
+        if not _waiter_counts[review_id]:
+            del _waiter_counts[review_id]
+            if _events.get(review_id) is event:
+                del _events[review_id]
+
+
+def notify_decision(review_id: int) -> None:
+    """Run the decision listeners and wake everything waiting on a review's decision.
+
+    Args:
+        review_id: ID of the review that was decided
+    """
+    for listener in _listeners:
+        listener(review_id)
+
+    event = _events.pop(review_id, None)
+    if event is not None:
+        event.set()
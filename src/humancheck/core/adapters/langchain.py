@@ -328,6 +328,12 @@ class HumancheckLangchainAdapter:
         if not action_requests:
             return []
         
+        # Allowed decisions per tool, looked up by name for each action
+        config_map = {
+            cfg["action_name"]: cfg.get("allowed_decisions", ["approve", "reject", "edit"])
+            for cfg in hitl_request.get("review_configs", [])
+        }
+        
         # Create reviews in Humancheck
         review_ids = []
         for action in action_requests:
@@ -336,11 +342,6 @@ class HumancheckLangchainAdapter:
             description = action.get("description", "")
             
             # Get allowed decisions
-            review_configs = hitl_request.get("review_configs", [])
-            config_map = {
-                cfg["action_name"]: cfg.get("allowed_decisions", ["approve", "reject", "edit"])
-                for cfg in review_configs
-            }
             allowed = config_map.get(tool_name, ["approve", "reject", "edit"])
             
             try:
@@ -1,9 +1,10 @@
 """MCP adapter for Claude Desktop integration."""
-import asyncio
+from functools import lru_cache
 from typing import Any, Optional
 
 from ..models import DecisionType, ReviewStatus, UrgencyLevel
 from .base import ReviewAdapter, UniversalReview
+from .decision_events import wait_for_decision
 
 
 class McpAdapter(ReviewAdapter):
@@ -120,20 +121,11 @@ class McpAdapter(ReviewAdapter):
 
                 # Check if decision exists
                 if review.status != ReviewStatus.PENDING.value and review.decision:
-                    universal_review = UniversalReview(
-                        task_type=review.task_type,
-                        proposed_action=review.proposed_action,
-                        agent_reasoning=review.agent_reasoning,
-                        confidence_score=review.confidence_score,
-                        urgency=UrgencyLevel(review.urgency),
-                        framework=review.framework,
-                        metadata=review.meta_data,
-                        organization_id=review.organization_id,
-                        agent_id=review.agent_id,
-                    )
+                    universal_review = UniversalReview.from_review(review)
                     return self.from_universal(universal_review, review.decision)
 
-            await asyncio.sleep(poll_interval)
+            # Wakes early if the decision is made in this process
+            await wait_for_decision(review_id, poll_interval)
             elapsed += poll_interval
 
         raise TimeoutError(
@@ -165,9 +157,22 @@ class McpAdapter(ReviewAdapter):
                 raise ValueError(f"Invalid urgency. Must be one of: {valid_urgency}")
 
         # Validate confidence if provided
-        if "confidence" in framework_request:
-            confidence = framework_request["confidence"]
+        confidence = framework_request.get("confidence")
+        if confidence is not None:
             if not isinstance(confidence, (int, float)) or confidence < 0 or confidence > 1:
                 raise ValueError("confidence must be a number between 0 and 1")
 
         return True
+
+
+@lru_cache(maxsize=1)
+def get_mcp_adapter(db) -> McpAdapter:
+    """Get the MCP adapter for a database, reusing it across calls.
+
+    Args:
+        db: Database whose sessions the adapter uses
+
+    Returns:
+        McpAdapter instance
+    """
+    return McpAdapter(db.session)
@@ -1,9 +1,11 @@
 """REST API adapter for universal HTTP integration."""
-import asyncio
 from typing import Any, Optional
 
+from sqlalchemy import select
+
 from ..models import DecisionType, ReviewStatus, UrgencyLevel
 from .base import ReviewAdapter, UniversalReview
+from .decision_events import wait_for_decision
 
 
 class RestAdapter(ReviewAdapter):
@@ -116,21 +118,14 @@ class RestAdapter(ReviewAdapter):
 
                 # Check if decision exists
                 if review.status != ReviewStatus.PENDING.value:
-                    decision = await session.get(Decision, review_id)
-                    universal_review = UniversalReview(
-                        task_type=review.task_type,
-                        proposed_action=review.proposed_action,
-                        agent_reasoning=review.agent_reasoning,
-                        confidence_score=review.confidence_score,
-                        urgency=UrgencyLevel(review.urgency),
-                        framework=review.framework,
-                        metadata=review.meta_data,
-                        organization_id=review.organization_id,
-                        agent_id=review.agent_id,
+                    decision = await session.scalar(
+                        select(Decision).where(Decision.review_id == review_id)
                     )
+                    universal_review = UniversalReview.from_review(review)
                     return self.from_universal(universal_review, decision)
 
-            await asyncio.sleep(poll_interval)
+            # Wakes early if the decision is made in this process
+            await wait_for_decision(review_id, poll_interval)
             elapsed += poll_interval
 
         raise TimeoutError(f"Review {review_id} timed out after {timeout} seconds")
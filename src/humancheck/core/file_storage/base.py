@@ -1,6 +1,7 @@
 """Base storage provider interface."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from typing import AsyncIterator, BinaryIO, Optional, Tuple
 
 
 class StorageProvider(ABC):
@@ -41,6 +42,24 @@ class StorageProvider(ABC):
         """
         pass
 
+    async def stream(self, key: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """
+        Stream a file from storage in chunks.
+
+        Providers that can read incrementally should override this; the default
+        falls back to a full download.
+
+        Args:
+            key: Storage key of the file
+            chunk_size: Maximum number of bytes per chunk
+
+        Yields:
+            File contents in chunks
+        """
+        content = await self.download(key)
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """
@@ -87,6 +106,26 @@ class StorageProvider(ABC):
         """
         pass
 
+    async def get_urls(self, key: str, expires_in: int = 3600) -> Tuple[str, str]:
+        """
+        Get both the inline (preview) and download URLs for a file.
+
+        Providers that sign URLs can override this to share the signing work; the
+        default requests both URLs concurrently.
+
+        Args:
+            key: Storage key of the file
+            expires_in: URL expiration time in seconds
+
+        Returns:
+            Tuple of (preview URL, download URL)
+        """
+        preview_url, download_url = await asyncio.gather(
+            self.get_url(key, expires_in=expires_in, download=False),
+            self.get_url(key, expires_in=expires_in, download=True),
+        )
+        return preview_url, download_url
+
     @abstractmethod
     async def get_metadata(self, key: str) -> dict:
         """
@@ -1,12 +1,77 @@
 """Local filesystem storage provider."""
+import asyncio
+import hashlib
 import json
 import os
+import re
+import tempfile
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import BinaryIO, Optional
+from typing import IO, AsyncIterator, BinaryIO, Iterator, Optional
 from urllib.parse import quote
 
 from .base import StorageProvider
 
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+# Read size used when streaming files to disk
+CHUNK_SIZE = 1024 * 1024
+
+# Storage keys: relative paths of word characters, dots, dashes and slashes (this matches
+# what sanitize_filename() produces, including non-ASCII letters)
+SAFE_KEY_PATTERN = re.compile(r"\w[\w.\-/]*")
+
+
+def _read_umask() -> Optional[int]:
+    """Read the process umask without changing it.
+
+    os.umask() can only read the mask by setting it, which races with other threads
+    creating files, so this reads it from /proc instead.
+
+    Returns:
+        The umask, or None where /proc isn't available
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str) -> Iterator[IO]:
+    """Open a temporary file that replaces ``path`` only once it's fully written.
+
+    Readers never see a partially written file, and concurrent writers to the
+    same path each write their own temporary file (last one wins).
+
+    Args:
+        path: Final file path
+        mode: Write mode ("w" or "wb")
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600 files; keep the permissions open() would have used where
+        # the umask can be read safely, and mkstemp's otherwise
+        umask = _read_umask()
+        if umask is not None:
+            os.chmod(tmp_path, 0o666 & ~umask)
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
 
 class LocalStorageProvider(StorageProvider):
     """Storage provider using local filesystem."""
@@ -22,10 +87,15 @@ class LocalStorageProvider(StorageProvider):
         self.base_path.mkdir(parents=True, exist_ok=True)
 
     def _get_file_path(self, key: str) -> Path:
-        """Get full file path for a storage key."""
-        # Sanitize the key to prevent directory traversal
-        safe_key = key.replace("..", "").lstrip("/")
-        return self.base_path / safe_key
+        """Get full file path for a storage key.
+
+        Raises:
+            ValueError: If the key is absolute, contains characters outside word
+                characters, ".", "-" and "/", or would escape the storage directory
+        """
+        if not SAFE_KEY_PATTERN.fullmatch(key) or os.path.normpath(key).startswith(".."):
+            raise ValueError(f"Invalid storage key: {key!r}")
+        return self.base_path / key
 
     def _get_metadata_path(self, key: str) -> Path:
         """Get metadata file path for a storage key."""
@@ -44,24 +114,39 @@ class LocalStorageProvider(StorageProvider):
         # Create parent directories
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file
-        with open(file_path, "wb") as f:
-            content = file.read()
-            f.write(content)
+        # Copy off the event loop; large uploads would otherwise block it
+        size, checksum = await asyncio.to_thread(self._write_file, file, file_path)
 
         # Write metadata
         meta = {
             "content_type": content_type,
-            "size": len(content),
+            "size": size,
+            "checksum": checksum,
             **(metadata or {}),
         }
 
         meta_path = self._get_metadata_path(key)
-        with open(meta_path, "w") as f:
-            json.dump(meta, f)
+        with _atomic_open(meta_path, "wb") as f:
+            f.write(orjson.dumps(meta) if orjson is not None else json.dumps(meta).encode())
 
         return key
 
+    @staticmethod
+    def _write_file(file: BinaryIO, file_path: Path) -> tuple[int, str]:
+        """Stream a file to disk in chunks, hashing as we go.
+
+        Returns:
+            Tuple of (bytes written, SHA-256 hex digest)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        with _atomic_open(file_path, "wb") as f:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+        return size, digest.hexdigest()
+
     async def download(self, key: str) -> bytes:
         """Download a file from local storage."""
         file_path = self._get_file_path(key)
@@ -72,6 +157,20 @@ class LocalStorageProvider(StorageProvider):
         with open(file_path, "rb") as f:
             return f.read()
 
+    async def stream(self, key: str, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Stream a file from local storage, reading chunks off the event loop."""
+        file_path = self._get_file_path(key)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {key}")
+
+        f = await asyncio.to_thread(open, file_path, "rb")
+        try:
+            while chunk := await asyncio.to_thread(f.read, chunk_size):
+                yield chunk
+        finally:
+            f.close()
+
     async def delete(self, key: str) -> bool:
         """Delete a file from local storage."""
         file_path = self._get_file_path(key)
@@ -113,6 +212,11 @@ class LocalStorageProvider(StorageProvider):
         disposition = "attachment" if download else "inline"
         return f"/api/attachments/download/{encoded_key}?disposition={disposition}"
 
+    async def get_urls(self, key: str, expires_in: int = 3600) -> tuple[str, str]:
+        """Get the inline and download URLs, encoding the key once."""
+        base_url = f"/api/attachments/download/{quote(key)}?disposition="
+        return f"{base_url}inline", f"{base_url}attachment"
+
     async def get_metadata(self, key: str) -> dict:
         """Get metadata for a stored file."""
         meta_path = self._get_metadata_path(key)
@@ -120,5 +224,5 @@ class LocalStorageProvider(StorageProvider):
         if not meta_path.exists():
             return {}
 
-        with open(meta_path, "r") as f:
-            return json.load(f)
+        data = meta_path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
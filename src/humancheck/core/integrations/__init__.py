@@ -1,6 +1,9 @@
 """Communication channel connectors for review notifications."""
 from .base import ReviewConnector
 from .slack.client import SlackConnector
-from .manager import ConnectorManager
+from .manager import ConnectorManager, close_connectors, invalidate_connector_cache
 
-__all__ = ['ReviewConnector', 'SlackConnector', 'ConnectorManager']
+__all__ = [
+    'ReviewConnector', 'SlackConnector', 'ConnectorManager', 'close_connectors',
+    'invalidate_connector_cache'
+]
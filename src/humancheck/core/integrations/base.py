@@ -1,9 +1,35 @@
 """Base connector interface for communication channels."""
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from ..models import Decision, Review
 
+URGENCY_EMOJI = {
+    'low': '🟢',
+    'medium': '🟡',
+    'high': '🟠',
+    'critical': '🔴'
+}
+
+DECISION_EMOJI = {
+    'approve': '✅',
+    'reject': '❌',
+    'modify': '✏️'
+}
+
+
+@lru_cache(maxsize=256)
+def _review_message_prefix(urgency: str, task_type: str) -> str:
+    """Static leading lines of a review message, cached per (urgency, task_type)."""
+    return "\n".join([
+        f"{URGENCY_EMOJI.get(urgency, '⚪')} New Review Request",
+        "",
+        f"**Task Type:** {task_type}",
+        f"**Urgency:** {urgency.upper()}",
+        "**Proposed Action:**",
+    ])
+
 
 class ReviewConnector(ABC):
     """Base abstract class for review notification connectors.
@@ -73,7 +99,8 @@ class ReviewConnector(ABC):
         self,
         message_id: str,
         review: Review,
-        decision: Optional[Decision] = None
+        decision: Optional[Decision] = None,
+        channel: Optional[str] = None
     ) -> Dict[str, Any]:
         """Update an existing notification (optional, for interactive channels).
 
@@ -81,6 +108,7 @@ class ReviewConnector(ABC):
             message_id: External message ID to update
             review: Updated review data
             decision: Decision if one was made
+            channel: Channel the original message was posted to, if the connector needs it
 
         Returns:
             Dict with success status
@@ -99,6 +127,13 @@ class ReviewConnector(ABC):
         """
         return {'success': True, 'message': 'No test implemented'}
 
+    async def aclose(self) -> None:
+        """Release resources held by the connector (background tasks, etc.).
+
+        Called when a cached connector instance is dropped and at shutdown. The
+        default implementation holds nothing to release.
+        """
+
     def format_review_message(self, review: Review) -> str:
         """Format a review into a human-readable message.
 
@@ -108,30 +143,19 @@ class ReviewConnector(ABC):
         Returns:
             Formatted string representation
         """
-        urgency_emoji = {
-            'low': '🟢',
-            'medium': '🟡',
-            'high': '🟠',
-            'critical': '🔴'
-        }
-
-        emoji = urgency_emoji.get(review.urgency, '⚪')
-
-        message = f"""{emoji} New Review Request
-
-**Task Type:** {review.task_type}
-**Urgency:** {review.urgency.upper()}
-**Proposed Action:**
-{review.proposed_action}
-"""
+        parts = [
+            _review_message_prefix(review.urgency, review.task_type),
+            review.proposed_action,
+        ]
 
         if review.agent_reasoning:
-            message += f"\n**Agent Reasoning:**\n{review.agent_reasoning}\n"
+            parts.extend(["", "**Agent Reasoning:**", review.agent_reasoning])
 
         if review.confidence_score:
-            message += f"\n**Confidence:** {review.confidence_score:.1%}\n"
+            parts.extend(["", f"**Confidence:** {review.confidence_score:.1%}"])
 
-        return message
+        parts.append("")
+        return "\n".join(parts)
 
     def format_decision_message(self, review: Review, decision: Decision) -> str:
         """Format a decision into a human-readable message.
@@ -143,24 +167,20 @@ class ReviewConnector(ABC):
         Returns:
             Formatted string representation
         """
-        decision_emoji = {
-            'approve': '✅',
-            'reject': '❌',
-            'modify': '✏️'
-        }
-
-        emoji = decision_emoji.get(decision.decision_type, '📋')
-
-        message = f"""{emoji} Decision: {decision.decision_type.upper()}
+        emoji = DECISION_EMOJI.get(decision.decision_type, '📋')
 
-**Task Type:** {review.task_type}
-**Original Action:** {review.proposed_action}
-"""
+        parts = [
+            f"{emoji} Decision: {decision.decision_type.upper()}",
+            "",
+            f"**Task Type:** {review.task_type}",
+            f"**Original Action:** {review.proposed_action}",
+        ]
 
         if decision.modified_action:
-            message += f"\n**Modified Action:** {decision.modified_action}\n"
+            parts.extend(["", f"**Modified Action:** {decision.modified_action}"])
 
         if decision.notes:
-            message += f"\n**Notes:** {decision.notes}\n"
+            parts.extend(["", f"**Notes:** {decision.notes}"])
 
-        return message
+        parts.append("")
+        return "\n".join(parts)
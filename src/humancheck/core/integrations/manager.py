@@ -1,6 +1,9 @@
 """Connector manager for orchestrating review notifications."""
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Type
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Type
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,6 +16,132 @@ from ..routing.engine import RoutingEngine
 
 logger = logging.getLogger(__name__)
 
+# Connector instances are shared across managers (one manager is created per request),
+# expiring after CONNECTOR_CACHE_TTL seconds so config edits made elsewhere are picked up
+CONNECTOR_CACHE_TTL = 60.0
+CONNECTOR_CACHE_SIZE = 1024
+_connector_instances: "OrderedDict[int, tuple[float, ReviewConnector]]" = OrderedDict()
+# Strong references to connector close tasks until they finish
+_closing: Set[asyncio.Task] = set()
+
+
+def _close_dropped(connector: ReviewConnector) -> None:
+    """Close a connector dropped from the cache without blocking the caller.
+
+    Outside a running event loop there's nothing to schedule on; the connector's own
+    resources are then released when it next runs on a loop, or at shutdown.
+    """
+    try:
+        task = asyncio.get_running_loop().create_task(connector.aclose())
+    except RuntimeError:
+        return
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def _get_cached_connector(connector_id: int) -> Optional[ReviewConnector]:
+    """Get a cached connector instance if it hasn't expired."""
+    entry = _connector_instances.get(connector_id)
+    if entry is None:
+        return None
+
+    expires_at, connector = entry
+    if expires_at <= time.monotonic():
+        del _connector_instances[connector_id]
+        _close_dropped(connector)
+        return None
+
+    _connector_instances.move_to_end(connector_id)
+    return connector
+
+
+def _cache_connector(connector_id: int, connector: ReviewConnector) -> None:
+    """Cache a connector instance, evicting the least recently used past the size limit."""
+    previous = _connector_instances.get(connector_id)
+    if previous is not None and previous[1] is not connector:
+        _close_dropped(previous[1])
+
+    _connector_instances[connector_id] = (time.monotonic() + CONNECTOR_CACHE_TTL, connector)
+    _connector_instances.move_to_end(connector_id)
+    while len(_connector_instances) > CONNECTOR_CACHE_SIZE:
+        _, (_, evicted) = _connector_instances.popitem(last=False)
+        _close_dropped(evicted)
+
+
+def invalidate_connector_cache(connector_id: Optional[int] = None) -> None:
+    """Drop a cached connector instance, or all of them.
+
+    Args:
+        connector_id: Connector to drop, or None to clear the whole cache
+    """
+    if connector_id is None:
+        dropped = [connector for _, connector in _connector_instances.values()]
+        _connector_instances.clear()
+    else:
+        entry = _connector_instances.pop(connector_id, None)
+        dropped = [entry[1]] if entry is not None else []
+
+    for connector in dropped:
+        _close_dropped(connector)
+
+
+def _recipient_outcomes(
+    result: Dict[str, Any], recipients: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """Split a connector send result into one outcome per recipient.
+
+    Connectors that report per-recipient ``results`` (e.g. Slack) only list the
+    recipients that were sent to; any other recipient failed. Connectors that report
+    a single outcome apply it to every recipient.
+
+    Args:
+        result: Result returned by the connector's send method
+        recipients: Recipients the send was addressed to
+
+    Returns:
+        Dict of recipient -> {status, error_message, message_id, channel}
+    """
+    if 'results' not in result:
+        return {
+            recipient: {
+                'status': 'sent' if result['success'] else 'failed',
+                'error_message': result.get('error'),
+                'message_id': result.get('message_id'),
+                'channel': None,
+            }
+            for recipient in recipients
+        }
+
+    sent = {r['recipient']: r for r in result['results']}
+    outcomes = {}
+    for recipient in recipients:
+        recipient_result = sent.get(recipient)
+        if recipient_result is None:
+            outcomes[recipient] = {
+                'status': 'failed',
+                'error_message': result.get('error') or 'Message was not delivered to recipient',
+                'message_id': None,
+                'channel': None,
+            }
+        else:
+            outcomes[recipient] = {
+                'status': 'sent',
+                'error_message': None,
+                'message_id': recipient_result.get('message_id'),
+                'channel': recipient_result.get('channel'),
+            }
+    return outcomes
+
+
+async def close_connectors() -> None:
+    """Close and drop every cached connector instance (e.g. at shutdown)."""
+    connectors = [connector for _, connector in _connector_instances.values()]
+    _connector_instances.clear()
+    for connector in connectors:
+        await connector.aclose()
+    if _closing:
+        await asyncio.gather(*_closing, return_exceptions=True)
+
 
 class ConnectorManager:
     """Central service for managing connectors and routing notifications.
@@ -41,7 +170,6 @@ class ConnectorManager:
         """
         self.session = session
         self.routing_engine = RoutingEngine()
-        self._connector_cache: Dict[int, ReviewConnector] = {}
 
     async def send_review_notification(
         self,
@@ -81,24 +209,24 @@ class ConnectorManager:
                     additional_context
                 )
 
-                # Log the notification
-                for recipient in recipients:
-                    log = NotificationLog(
+                # Log each recipient's own outcome, keeping its message/channel for updates
+                outcomes = _recipient_outcomes(result, recipients)
+                notification_logs.extend(
+                    NotificationLog(
                         review_id=review.id,
                         connector_id=connector_config.id,
-                        status='sent' if result['success'] else 'failed',
-                        error_message=result.get('error'),
+                        status=outcome['status'],
+                        error_message=outcome['error_message'],
                         recipient=recipient,
-                        message_id=result.get('message_id'),
+                        message_id=outcome['message_id'],
                         notification_metadata={
                             'connector_type': connector_config.connector_type,
+                            'channel': outcome['channel'],
                             'result': result
                         }
                     )
-                    self.session.add(log)
-                    notification_logs.append(log)
-
-                await self.session.commit()
+                    for recipient, outcome in outcomes.items()
+                )
 
                 if result['success']:
                     logger.info(
@@ -118,18 +246,20 @@ class ConnectorManager:
                 )
 
                 # Still log the failure
-                for recipient in recipients:
-                    log = NotificationLog(
+                notification_logs.extend(
+                    NotificationLog(
                         review_id=review.id,
                         connector_id=connector_config.id,
                         status='failed',
                         error_message=str(e),
                         recipient=recipient
                     )
-                    self.session.add(log)
-                    notification_logs.append(log)
+                    for recipient in recipients
+                )
 
-                await self.session.commit()
+        # Write all log rows in one batched INSERT
+        self.session.add_all(notification_logs)
+        await self.session.commit()
 
         return notification_logs
 
@@ -147,6 +277,9 @@ class ConnectorManager:
         Returns:
             List of notification logs created
         """
+        # Edit the original review messages in place so they show the outcome
+        await self.update_review_notifications(review, decision)
+
         # Use routing engine (same routes as original review)
         routes = await self.routing_engine.route_review(
             review,
@@ -165,24 +298,24 @@ class ConnectorManager:
                     recipients
                 )
 
-                for recipient in recipients:
-                    log = NotificationLog(
+                outcomes = _recipient_outcomes(result, recipients)
+                notification_logs.extend(
+                    NotificationLog(
                         review_id=review.id,
                         connector_id=connector_config.id,
-                        status='sent' if result['success'] else 'failed',
-                        error_message=result.get('error'),
+                        status=outcome['status'],
+                        error_message=outcome['error_message'],
                         recipient=recipient,
-                        message_id=result.get('message_id'),
+                        message_id=outcome['message_id'],
                         notification_metadata={
                             'connector_type': connector_config.connector_type,
                             'decision_type': decision.decision_type,
+                            'channel': outcome['channel'],
                             'result': result
                         }
                     )
-                    self.session.add(log)
-                    notification_logs.append(log)
-
-                await self.session.commit()
+                    for recipient, outcome in outcomes.items()
+                )
 
                 if result['success']:
                     logger.info(
@@ -196,8 +329,77 @@ class ConnectorManager:
                     exc_info=True
                 )
 
+        self.session.add_all(notification_logs)
+        await self.session.commit()
+
         return notification_logs
 
+    async def update_review_notifications(
+        self,
+        review: Review,
+        decision: Optional[Decision] = None
+    ) -> List[Dict[str, Any]]:
+        """Update previously sent review notifications in place.
+
+        Uses the message ID and channel stored on each NotificationLog so interactive
+        connectors (e.g. Slack) edit the original message instead of posting a new one.
+
+        Args:
+            review: The review whose notifications should be updated
+            decision: Decision if one was made
+
+        Returns:
+            List of update results, one per notification log
+        """
+        query = (
+            select(NotificationLog)
+            .where(NotificationLog.review_id == review.id)
+            .where(NotificationLog.status == 'sent')
+            .where(NotificationLog.message_id.is_not(None))
+        )
+        result = await self.session.execute(query)
+        logs = [
+            log for log in result.scalars().all()
+            # Decision messages aren't updated
+            if 'decision_type' not in (log.notification_metadata or {})
+        ]
+
+        # Load configs for connectors that aren't cached in one query
+        missing = {
+            log.connector_id for log in logs
+            if _get_cached_connector(log.connector_id) is None
+        }
+        configs: Dict[int, ConnectorConfig] = {}
+        if missing:
+            config_result = await self.session.execute(
+                select(ConnectorConfig).where(ConnectorConfig.id.in_(missing))
+            )
+            configs = {config.id: config for config in config_result.scalars().all()}
+
+        results = []
+        for log in logs:
+            metadata = log.notification_metadata or {}
+            try:
+                connector = _get_cached_connector(log.connector_id)
+                if connector is None:
+                    config = configs.get(log.connector_id)
+                    if config is None:
+                        raise ValueError(f"Connector {log.connector_id} not found")
+                    connector = await self._get_connector(config)
+                update = await connector.update_notification(
+                    log.message_id,
+                    review,
+                    decision,
+                    channel=metadata.get('channel')
+                )
+            except Exception as e:
+                logger.error(f"Error updating notification {log.id}: {e}", exc_info=True)
+                update = {'success': False, 'error': str(e)}
+
+            results.append({'notification_id': log.id, **update})
+
+        return results
+
     async def create_connector(
         self,
         connector_type: str,
@@ -310,9 +512,8 @@ class ConnectorManager:
             if hasattr(config, key):
                 setattr(config, key, value)
 
-        # If config_data was updated, clear cache
-        if 'config_data' in updates and connector_id in self._connector_cache:
-            del self._connector_cache[connector_id]
+        # Rebuild the connector instance from the new config on next use
+        invalidate_connector_cache(connector_id)
 
         await self.session.commit()
         await self.session.refresh(config)
@@ -334,8 +535,7 @@ class ConnectorManager:
             return False
 
         # Clear from cache
-        if connector_id in self._connector_cache:
-            del self._connector_cache[connector_id]
+        invalidate_connector_cache(connector_id)
 
         await self.session.delete(config)
         await self.session.commit()
@@ -375,8 +575,9 @@ class ConnectorManager:
             ValueError: If connector type is not supported
         """
         # Check cache first
-        if config.id in self._connector_cache:
-            return self._connector_cache[config.id]
+        connector = _get_cached_connector(config.id)
+        if connector is not None:
+            return connector
 
         # Get connector class
         connector_class = self.CONNECTOR_TYPES.get(config.connector_type)
@@ -387,7 +588,7 @@ class ConnectorManager:
         connector = connector_class(config.config_data)
 
         # Cache it
-        self._connector_cache[config.id] = connector
+        _cache_connector(config.id, connector)
 
         return connector
 
@@ -1,5 +1,4 @@
 """Slack connector for review notifications."""
-from .client import SlackConnector
-
-__all__ = ["SlackConnector"]
+from .client import SlackConnector, close_shared_session
 
+__all__ = ["SlackConnector", "close_shared_session"]
@@ -1,15 +1,104 @@
 """Slack connector for sending review notifications."""
+import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
+import aiohttp
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
-from ..base import ReviewConnector
+from ..base import DECISION_EMOJI, URGENCY_EMOJI, ReviewConnector
 from ...models import Decision, Review
 
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Send queue limits (per connector, i.e. per workspace token)
+SEND_QUEUE_SIZE = 1024
+MAX_IN_FLIGHT = 20
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Fallback (notification) text templates
+_REVIEW_FALLBACK = "New review request: %s"
+_DECISION_FALLBACK = "Decision made: %s - %s"
+
+
+def _header_block(text: str) -> Dict[str, Any]:
+    """Build a Block Kit header block."""
+    return {"type": "header", "text": {"type": "plain_text", "text": text}}
+
+
+# Header text is static per urgency/decision type, so only the formatting is cached;
+# each message gets its own block dicts
+@lru_cache(maxsize=32)
+def _review_header_text(urgency: str) -> str:
+    """Header text for a review notification."""
+    return f"{URGENCY_EMOJI.get(urgency, '⚪')} New Review Request"
+
+
+@lru_cache(maxsize=32)
+def _decision_header_text(decision_type: str) -> str:
+    """Header text for a decision notification."""
+    return f"{DECISION_EMOJI.get(decision_type, '📋')} Decision: {decision_type.upper()}"
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Shared HTTP session so TCP/TLS connections to Slack are reused across connectors.
+# A session only works on the event loop it was created on, so it's kept per loop.
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_session() -> Optional[aiohttp.ClientSession]:
+    """Get (or lazily create) the aiohttp session shared by Slack clients on this loop.
+
+    Returns:
+        Shared ClientSession, or None when called outside a running event loop
+        (AsyncWebClient then falls back to a per-request session)
+    """
+    global _shared_session, _shared_session_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        # A session left on another loop can't be closed from here; it goes with its loop
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75),
+            json_serialize=_json_dumps
+        )
+        _shared_session_loop = loop
+
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared Slack HTTP session, if one was created on this loop."""
+    global _shared_session, _shared_session_loop
+
+    if (
+        _shared_session is not None
+        and not _shared_session.closed
+        and _shared_session_loop is asyncio.get_running_loop()
+    ):
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+
 
 class SlackConnector(ReviewConnector):
     """Slack connector for sending review notifications to Slack channels.
@@ -24,7 +113,16 @@ class SlackConnector(ReviewConnector):
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.client = AsyncWebClient(token=config.get("bot_token"))
+        self.client = AsyncWebClient(
+            token=config.get("bot_token"),
+            session=_get_shared_session()
+        )
+
+        # Outgoing API calls go through a single queue drained by one worker task
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._send_slots: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
 
     def _get_connector_type(self) -> str:
         return "slack"
@@ -49,36 +147,17 @@ class SlackConnector(ReviewConnector):
             # Build Slack blocks for rich formatting
             blocks = self._build_review_blocks(review, additional_context)
 
-            results = []
-            for recipient in recipients:
-                # Post message to channel
-                response = await self.client.chat_postMessage(
-                    channel=recipient,
-                    blocks=blocks,
-                    text=f"New review request: {review.task_type}"  # Fallback text
+            results = await self._post_to_recipients(
+                recipients,
+                blocks,
+                _REVIEW_FALLBACK % review.task_type  # Fallback text
+            )
+            for result in results:
+                logger.info(
+                    f"Sent Slack notification for review {review.id} to {result['recipient']}"
                 )
 
-                if response["ok"]:
-                    results.append({
-                        "recipient": recipient,
-                        "message_id": response["ts"],  # Slack timestamp serves as message ID
-                        "channel": response["channel"]
-                    })
-                    logger.info(f"Sent Slack notification for review {review.id} to {recipient}")
-                else:
-                    logger.error(f"Failed to send Slack notification: {response.get('error')}")
-
-            if results:
-                return {
-                    "success": True,
-                    "message_id": results[0]["message_id"],  # Primary message ID
-                    "results": results
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "No messages sent successfully"
-                }
+            return self._batch_result(results)
 
         except SlackApiError as e:
             logger.error(f"Slack API error: {e.response['error']}")
@@ -112,32 +191,13 @@ class SlackConnector(ReviewConnector):
         try:
             blocks = self._build_decision_blocks(review, decision)
 
-            results = []
-            for recipient in recipients:
-                response = await self.client.chat_postMessage(
-                    channel=recipient,
-                    blocks=blocks,
-                    text=f"Decision made: {decision.decision_type} - {review.task_type}"
-                )
+            results = await self._post_to_recipients(
+                recipients,
+                blocks,
+                _DECISION_FALLBACK % (decision.decision_type, review.task_type)
+            )
 
-                if response["ok"]:
-                    results.append({
-                        "recipient": recipient,
-                        "message_id": response["ts"],
-                        "channel": response["channel"]
-                    })
-
-            if results:
-                return {
-                    "success": True,
-                    "message_id": results[0]["message_id"],
-                    "results": results
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "No messages sent successfully"
-                }
+            return self._batch_result(results)
 
         except SlackApiError as e:
             logger.error(f"Slack API error: {e.response['error']}")
@@ -146,11 +206,170 @@ class SlackConnector(ReviewConnector):
                 "error": f"Slack API error: {e.response['error']}"
             }
 
+    async def _post_to_recipients(
+        self,
+        recipients: List[str],
+        blocks: List[Dict],
+        text: str
+    ) -> List[Dict[str, Any]]:
+        """Post the same message to all recipients concurrently.
+
+        Failures are logged per recipient so one bad channel doesn't abort the batch.
+
+        Args:
+            recipients: List of Slack channel IDs or names
+            blocks: Prebuilt Slack Block Kit blocks
+            text: Fallback text
+
+        Returns:
+            List of per-recipient results for messages that were sent
+        """
+        post = self.client.chat_postMessage
+        enqueue = self._enqueue
+        futures = [
+            await enqueue(
+                lambda recipient=recipient: post(channel=recipient, blocks=blocks, text=text)
+            )
+            for recipient in recipients
+        ]
+        responses = await asyncio.gather(*futures, return_exceptions=True)
+
+        results = []
+        for recipient, response in zip(recipients, responses):
+            if isinstance(response, SlackApiError):
+                logger.error(f"Slack API error for {recipient}: {response.response['error']}")
+            elif isinstance(response, Exception):
+                logger.error(f"Unexpected error sending Slack notification to {recipient}: {response}")
+            elif response["ok"]:
+                results.append({
+                    "recipient": recipient,
+                    "message_id": response["ts"],  # Slack timestamp serves as message ID
+                    "channel": response["channel"]
+                })
+            else:
+                logger.error(f"Failed to send Slack notification: {response.get('error')}")
+
+        return results
+
+    @staticmethod
+    def _batch_result(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap per-recipient results in the connector response format."""
+        if results:
+            return {
+                "success": True,
+                "message_id": results[0]["message_id"],  # Primary message ID
+                "results": results
+            }
+        return {
+            "success": False,
+            "error": "No messages sent successfully"
+        }
+
+    def _use_shared_session(self) -> None:
+        """Point the Slack client at the running loop's shared HTTP session."""
+        self.client.session = _get_shared_session()
+
+    async def _enqueue(self, call: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """Queue a Slack API call for the send worker.
+
+        Blocks when the queue is full, which back-pressures producers during bursts.
+
+        Args:
+            call: Zero-argument factory returning the API call coroutine
+
+        Returns:
+            Future resolved with the API response (or the raised exception)
+        """
+        self._use_shared_session()
+
+        # The queue and worker belong to one event loop; start fresh on a new one
+        if (
+            self._worker is None
+            or self._worker.done()
+            or self._worker.get_loop() is not asyncio.get_running_loop()
+        ):
+            if self._worker is not None:
+                self._cancel_elsewhere(self._worker)
+            self._send_queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+            self._send_slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+            self._worker = asyncio.create_task(self._drain())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._send_queue.put((call, future))
+        return future
+
+    async def aclose(self) -> None:
+        """Stop the send worker, failing calls that are still queued.
+
+        Calls already in flight run to completion. The connector can be used again
+        afterwards; the next send starts a new worker.
+        """
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+
+        if worker.get_loop() is asyncio.get_running_loop():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+            while not self._send_queue.empty():
+                _, future = self._send_queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Slack connector closed"))
+
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+        else:
+            self._cancel_elsewhere(worker)
+
+    @staticmethod
+    def _cancel_elsewhere(worker: asyncio.Task) -> None:
+        """Cancel a worker that belongs to another (or no longer running) event loop."""
+        loop = worker.get_loop()
+        if not worker.done() and not loop.is_closed():
+            loop.call_soon_threadsafe(worker.cancel)
+
+    async def _drain(self) -> None:
+        """Worker loop: issue queued calls with at most MAX_IN_FLIGHT outstanding."""
+        while True:
+            item: Tuple[Callable[[], Awaitable[Any]], asyncio.Future] = await self._send_queue.get()
+            await self._send_slots.acquire()
+            task = asyncio.create_task(self._issue(*item))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _issue(self, call: Callable[[], Awaitable[Any]], future: asyncio.Future) -> None:
+        """Run one queued call, honoring Retry-After when Slack rate limits us."""
+        try:
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                try:
+                    response = await call()
+                    break
+                except SlackApiError as e:
+                    if e.response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                        raise
+                    retry_after = int(e.response.headers.get("Retry-After", 1))
+                    logger.warning(f"Slack rate limited, retrying in {retry_after}s")
+                    await asyncio.sleep(retry_after)
+
+            if not future.done():
+                future.set_result(response)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            self._send_slots.release()
+            self._send_queue.task_done()
+
     async def update_notification(
         self,
         message_id: str,
         review: Review,
-        decision: Optional[Decision] = None
+        decision: Optional[Decision] = None,
+        channel: Optional[str] = None
     ) -> Dict[str, Any]:
         """Update an existing Slack message with decision information.
 
@@ -158,21 +377,43 @@ class SlackConnector(ReviewConnector):
             message_id: Slack message timestamp (ts)
             review: Updated review data
             decision: Decision if one was made
+            channel: Slack channel ID the message was posted to (stored in NotificationLog metadata)
 
         Returns:
-            Dict with success status
+            Dict with success status and message_id
         """
+        if not channel:
+            return {
+                "success": False,
+                "error": "Channel is required to update a Slack message"
+            }
+
         try:
-            # Find the channel from notification logs
-            # For now, we'll need to store channel info in metadata
-            # This is a simplified version
-            blocks = self._build_decision_blocks(review, decision) if decision else self._build_review_blocks(review, {})
+            if decision:
+                blocks = self._build_decision_blocks(review, decision)
+                text = _DECISION_FALLBACK % (decision.decision_type, review.task_type)
+            else:
+                blocks = self._build_review_blocks(review, {})
+                text = _REVIEW_FALLBACK % review.task_type
 
-            # Note: We need the channel ID to update. In production, store this in NotificationLog metadata
-            # For now, this is a placeholder
+            response = await (await self._enqueue(
+                lambda: self.client.chat_update(
+                    channel=channel,
+                    ts=message_id,
+                    blocks=blocks,
+                    text=text
+                )
+            ))
+
+            if response["ok"]:
+                return {
+                    "success": True,
+                    "message_id": response["ts"],
+                    "channel": response["channel"]
+                }
             return {
-                "success": True,
-                "message": "Update would happen here with proper channel tracking"
+                "success": False,
+                "error": response.get("error")
             }
 
         except SlackApiError as e:
@@ -188,6 +429,7 @@ class SlackConnector(ReviewConnector):
         Returns:
             Dict with connection status and bot info
         """
+        self._use_shared_session()
         try:
             response = await self.client.auth_test()
             if response["ok"]:
@@ -223,23 +465,8 @@ class SlackConnector(ReviewConnector):
         Returns:
             List of Slack Block Kit blocks
         """
-        urgency_emoji = {
-            'low': '🟢',
-            'medium': '🟡',
-            'high': '🟠',
-            'critical': '🔴'
-        }
-
-        emoji = urgency_emoji.get(review.urgency, '⚪')
-
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} New Review Request"
-                }
-            },
+            _header_block(_review_header_text(review.urgency)),
             {
                 "type": "section",
                 "fields": [
@@ -313,22 +540,8 @@ class SlackConnector(ReviewConnector):
         Returns:
             List of Slack Block Kit blocks
         """
-        decision_emoji = {
-            'approve': '✅',
-            'reject': '❌',
-            'modify': '✏️'
-        }
-
-        emoji = decision_emoji.get(decision.decision_type, '📋')
-
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} Decision: {decision.decision_type.upper()}"
-                }
-            },
+            _header_block(_decision_header_text(decision.decision_type)),
             {
                 "type": "section",
                 "fields": [
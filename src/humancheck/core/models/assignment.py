@@ -1,5 +1,5 @@
 """ReviewAssignment model - moved from models.py"""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, func
@@ -30,7 +30,8 @@ class ReviewAssignment(Base):
         String(255), nullable=True
     )  # Team name identifier
     assigned_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
     assigned_by_rule_id: Mapped[Optional[int]] = mapped_column(
         Integer, nullable=True
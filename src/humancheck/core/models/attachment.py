@@ -1,10 +1,14 @@
 """Attachment model - moved from models.py"""
-from datetime import datetime
+import zlib
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, JSON, String, Text, func
+from sqlalchemy import (
+    DateTime, Enum as SqlEnum, ForeignKey, Integer, JSON, LargeBinary, String, Text, func
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 from ..storage.database import Base
 
@@ -19,6 +23,46 @@ class ContentCategory(str, Enum):
     OTHER = "other"
 
 
+class CompressedText(TypeDecorator):
+    """Text stored zlib-compressed in a binary column."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return zlib.compress(value.encode("utf-8"), 3)
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Rows written before the column was compressed hold plain text
+            return value
+        return zlib.decompress(value).decode("utf-8")
+
+
+class HexDigest(TypeDecorator):
+    """Hex digest string stored as raw bytes (half the size of the hex form)."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # Rows written before the column held raw bytes store the hex form
+            return value
+        return bytes(value).hex()
+
+
 class Attachment(Base):
     """File attachments for review requests."""
 
@@ -33,7 +77,10 @@ class Attachment(Base):
     file_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     content_type: Mapped[str] = mapped_column(String(100), nullable=False)
     content_category: Mapped[str] = mapped_column(
-        String(50), nullable=False, default=ContentCategory.OTHER.value, index=True
+        SqlEnum(
+            *(c.value for c in ContentCategory), name="content_category", native_enum=True, length=50
+        ),
+        nullable=False, default=ContentCategory.OTHER.value, index=True
     )
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # in bytes
 
@@ -44,7 +91,11 @@ class Attachment(Base):
     )
 
     # Content (for small text/inline content)
-    inline_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Large, seldom-read columns are deferred (group "large") so listings and downloads
+    # don't fetch them; use undefer_group("large") where they're needed
+    inline_content: Mapped[Optional[str]] = mapped_column(
+        CompressedText, nullable=True, deferred=True, deferred_group="large"
+    )
 
     # Preview URLs
     preview_url: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
@@ -52,17 +103,24 @@ class Attachment(Base):
     download_url: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
 
     # Additional metadata
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    file_metadata: Mapped[Optional[dict]] = mapped_column("metadata", JSON, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="large"
+    )
+    file_metadata: Mapped[Optional[dict]] = mapped_column(
+        "metadata", JSON, nullable=True, deferred=True, deferred_group="large"
+    )
 
     # Security
-    checksum: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # SHA256
+    checksum: Mapped[Optional[str]] = mapped_column(HexDigest(32), nullable=True)  # SHA256
     virus_scan_status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    virus_scan_result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    virus_scan_result: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="large"
+    )
 
     # Timestamps
     uploaded_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -1,8 +1,8 @@
 """Connector models - moved from connector_models.py"""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text, Boolean, func
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text, Boolean, desc, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..storage.database import Base
@@ -28,10 +28,12 @@ class ConnectorConfig(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), onupdate=lambda: datetime.now(timezone.utc), nullable=False
     )
 
     # Relationships
@@ -73,8 +75,9 @@ class NotificationLog(Base):
 
     # Timestamps
     sent_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False, index=True
+    )  # Indexed so time-window queries don't scan the whole log
     delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     read_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
@@ -93,6 +96,16 @@ class ConnectorRoutingRule(Base):
     """Rules for routing reviews to specific connectors."""
 
     __tablename__ = "connector_routing_rules"
+    __table_args__ = (
+        # Rule lookups filter enabled rules by organization and walk them highest priority
+        # first; the single-column enabled and priority indexes stay for other queries
+        Index(
+            "ix_connector_routing_rules_enabled_priority_org",
+            "enabled",
+            desc("priority"),
+            "organization_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     connector_id: Mapped[int] = mapped_column(
@@ -119,10 +132,12 @@ class ConnectorRoutingRule(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), onupdate=lambda: datetime.now(timezone.utc), nullable=False
     )
 
     # Relationships
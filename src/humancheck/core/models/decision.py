@@ -1,9 +1,10 @@
 """Decision model - moved from models.py"""
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..storage.database import Base
@@ -29,11 +30,17 @@ class Decision(Base):
         Integer, nullable=True, index=True
     )  # Optional reviewer ID (can be used for tracking, no FK)
     reviewer_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Reviewer identifier
-    decision_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    decision_type: Mapped[str] = mapped_column(
+        SqlEnum(
+            *(d.value for d in DecisionType), name="decision_type", native_enum=True, length=50
+        ),
+        nullable=False
+    )
     modified_action: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
 
     # Relationships
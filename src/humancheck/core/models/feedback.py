@@ -1,5 +1,5 @@
 """Feedback model - moved from models.py"""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy import DateTime, ForeignKey, Integer, Text, func
@@ -20,7 +20,8 @@ class Feedback(Base):
     rating: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 1-5 scale
     comment: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
 
     # Relationships
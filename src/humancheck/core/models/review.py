@@ -1,9 +1,10 @@
 """Review model - moved from models.py"""
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import JSON, DateTime, Float, Integer, String, Text, func
+from sqlalchemy import JSON, DateTime, Float, Index, Integer, String, Text, func, text
+from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..storage.database import Base
@@ -29,18 +30,41 @@ class Review(Base):
     """Core review request model."""
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Pending-review dashboards filter by status and order by urgency/age
+        Index("ix_reviews_status_urgency_created", "status", "urgency", "created_at"),
+        Index("ix_reviews_task_type_status", "task_type", "status"),
+        # Per-framework review listings filter by status and page newest-first
+        Index("ix_reviews_framework_status_created", "framework", "status", "created_at"),
+        # Queue-head lookups only ever touch pending rows
+        Index(
+            "ix_reviews_pending",
+            "created_at",
+            "urgency",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    task_type: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    task_type: Mapped[str] = mapped_column(String(255), nullable=False)
     proposed_action: Mapped[str] = mapped_column(Text, nullable=False)
     agent_reasoning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     confidence_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Enum columns hydrate to the declared value objects, so rows share one interned string
+    # per urgency/status instead of allocating a fresh str each
     urgency: Mapped[str] = mapped_column(
-        String(50), nullable=False, default=UrgencyLevel.MEDIUM.value, index=True
+        SqlEnum(
+            *(u.value for u in UrgencyLevel), name="urgency_level", native_enum=True, length=50
+        ),
+        nullable=False, default=UrgencyLevel.MEDIUM.value, index=True
     )
-    framework: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    framework: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     status: Mapped[str] = mapped_column(
-        String(50), nullable=False, default=ReviewStatus.PENDING.value, index=True
+        SqlEnum(
+            *(s.value for s in ReviewStatus), name="review_status", native_enum=True, length=50
+        ),
+        nullable=False, default=ReviewStatus.PENDING.value
     )
     meta_data: Mapped[Optional[dict]] = mapped_column("metadata", JSON, nullable=True)
 
@@ -49,15 +73,22 @@ class Review(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(), onupdate=lambda: datetime.now(timezone.utc), nullable=False
     )
 
     # Relationships
+    # decision is read alongside almost every review, so it's joined in by default
     decision: Mapped[Optional["Decision"]] = relationship(
-        "Decision", back_populates="review", uselist=False, cascade="all, delete-orphan"
+        "Decision",
+        back_populates="review",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="joined",
     )
     feedback: Mapped[list["Feedback"]] = relationship(
         "Feedback", back_populates="review", cascade="all, delete-orphan"
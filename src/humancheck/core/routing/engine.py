@@ -1,12 +1,43 @@
 """Routing engine for intelligent review assignment."""
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
 
 from ..config.settings import get_config
 from ..models import Review, ReviewAssignment
-from .evaluator import ConditionEvaluator
+from .evaluator import ConditionEvaluator, Predicate
+
+# (predicate, assign_to, assign_to_team) for each active rule, in config order
+CompiledRule = tuple[Predicate, Optional[str], Optional[str]]
+
+
+def _task_type_gate(conditions: dict[str, Any]) -> Optional[frozenset]:
+    """Get the task types a rule is restricted to by a top-level task_type condition.
+
+    Args:
+        conditions: Rule conditions
+
+    Returns:
+        The task types the rule can match, or None if it isn't gated on task_type
+    """
+    if not conditions or "and" in conditions or "or" in conditions:
+        return None
+
+    spec = conditions.get("task_type")
+    if isinstance(spec, str):
+        return frozenset((spec,))
+    if not isinstance(spec, dict):
+        return None
+
+    operator = spec.get("operator", "=")
+    value = spec.get("value")
+    if operator == "=" and isinstance(value, str):
+        return frozenset((value,))
+    if operator == "in" and isinstance(value, (list, tuple)):
+        if all(isinstance(item, str) for item in value):
+            return frozenset(value)
+    return None
 
 
 class RoutingEngine:
@@ -16,13 +47,20 @@ class RoutingEngine:
     to reviewers based on matching conditions.
     """
 
+    # Compiled rules shared across engine instances, keyed by the rules object they
+    # were built from (init_config() replaces the config, which invalidates this).
+    # Holds (rules, all compiled rules, candidates by task_type, ungated rules).
+    _compiled_cache: Optional[
+        tuple[Any, list[CompiledRule], dict[str, list[CompiledRule]], list[CompiledRule]]
+    ] = None
+
     def __init__(self):
         """Initialize the routing engine."""
         self.evaluator = ConditionEvaluator()
         self.config = get_config()
 
     async def route_review(
-        self, review: Review, session: Session | AsyncSession
+        self, review: Review, session: AsyncSession
     ) -> list[ReviewAssignment]:
         """Route a review to appropriate reviewers.
 
@@ -33,9 +71,64 @@ class RoutingEngine:
         Returns:
             List of ReviewAssignment objects created
         """
-        # Get routing rules from config
-        routing_rules = self.config.model_dump().get("routing_rules", [])
+        assignment = self._build_assignment(review)
+        if assignment is None:
+            return []
+
+        session.add(assignment)
+        await session.flush()
+
+        return [assignment]
 
+    async def route_reviews_bulk(
+        self, reviews: list[Review], session: AsyncSession
+    ) -> list[int]:
+        """Route many reviews via a Core bulk INSERT, skipping per-row ORM overhead.
+
+        Intended for large batches (e.g. replaying reviews). SQLAlchemy 2.x sends the
+        rows as multi-row INSERT ... RETURNING statements (insertmanyvalues), one
+        round trip per page instead of one per row.
+
+        Args:
+            reviews: Reviews to route (must already have IDs)
+            session: Database session
+
+        Returns:
+            IDs of the created ReviewAssignment rows
+        """
+        rows = [
+            {
+                "review_id": assignment.review_id,
+                "reviewer_identifier": assignment.reviewer_identifier,
+                "team_name": assignment.team_name,
+            }
+            for assignment in map(self._build_assignment, reviews)
+            if assignment is not None
+        ]
+        if not rows:
+            return []
+
+        return await self._bulk_create_assignments(rows, session)
+
+    @staticmethod
+    async def _bulk_create_assignments(
+        rows: list[dict[str, Any]], session: AsyncSession
+    ) -> list[int]:
+        """Insert assignment rows in bulk and return their IDs."""
+        stmt = insert(ReviewAssignment).returning(ReviewAssignment.id)
+        result = await session.execute(stmt, rows)
+        return list(result.scalars().all())
+
+    def _build_assignment(self, review: Review) -> Optional[ReviewAssignment]:
+        """Build (but don't persist) the assignment for a review.
+
+        Args:
+            review: Review to route
+
+        Returns:
+            ReviewAssignment from the first matching rule, the default assignment,
+            or None if neither applies
+        """
         # Prepare review data for evaluation
         review_data = {
             "task_type": review.task_type,
@@ -45,50 +138,103 @@ class RoutingEngine:
             "metadata": review.meta_data or {},
         }
 
-        assignments = []
+        # Evaluate rules in priority order (if configured), skipping rules whose
+        # task_type condition can't match this review
+        for matches, reviewer_identifier, team_name in self._get_candidate_rules(
+            review.task_type
+        ):
+            # Check if conditions match; stop after the first match with an assignee
+            if matches(review_data) and (reviewer_identifier or team_name):
+                return ReviewAssignment(
+                    review_id=review.id,
+                    reviewer_identifier=reviewer_identifier,
+                    team_name=team_name,
+                )
 
-        # Evaluate rules in priority order (if configured)
+        # If no rules matched, use default assignment
+        return self._build_default_assignment(review)
+
+    def warmup(self) -> int:
+        """Compile the configured routing rules ahead of the first review.
+
+        Returns:
+            Number of active rules compiled
+        """
+        return len(self._get_compiled_rules())
+
+    def _get_compiled_rules(self) -> list[CompiledRule]:
+        """Get the active routing rules compiled into predicates.
+
+        Returns:
+            List of (predicate, assign_to, assign_to_team) tuples
+        """
+        # Read the typed attribute directly; model_dump() would copy the whole config.
+        # `()` is a singleton, so a config without rules still hits the cache.
+        routing_rules = getattr(self.config, "routing_rules", None) or ()
+
+        return self._load_compiled_rules(routing_rules)[1]
+
+    def _get_candidate_rules(self, task_type: str) -> list[CompiledRule]:
+        """Get the compiled rules that can match a review with the given task type.
+
+        Args:
+            task_type: Task type of the review being routed
+
+        Returns:
+            Compiled rules in config order, excluding rules gated on other task types
+        """
+        routing_rules = getattr(self.config, "routing_rules", None) or ()
+        _, _, by_task_type, ungated = self._load_compiled_rules(routing_rules)
+        return by_task_type.get(task_type, ungated)
+
+    def _load_compiled_rules(self, routing_rules: Any):
+        """Compile routing rules and index them by task_type, reusing the cached result.
+
+        Args:
+            routing_rules: Routing rules from the config
+
+        Returns:
+            Cache entry of (rules, compiled rules, candidates by task_type, ungated rules)
+        """
+        cached = RoutingEngine._compiled_cache
+        if cached is not None and cached[0] is routing_rules:
+            return cached
+
+        compiled = []
+        gates = []
         for rule in routing_rules:
+            if not isinstance(rule, dict):
+                rule = rule.model_dump()
             if not rule.get("is_active", True):
                 continue
-
-            # Check if conditions match
             conditions = rule.get("conditions", {})
-            if self.evaluator.evaluate(conditions, review_data):
-                # Create assignment based on rule
-                reviewer_identifier = rule.get("assign_to")
-                team_name = rule.get("assign_to_team")
-
-                if reviewer_identifier or team_name:
-                    assignment = ReviewAssignment(
-                        review_id=review.id,
-                        reviewer_identifier=reviewer_identifier,
-                        team_name=team_name,
-                    )
-                    session.add(assignment)
-                    if isinstance(session, AsyncSession):
-                        await session.flush()
-                    else:
-                        session.flush()
-                    assignments.append(assignment)
-                    break  # Stop after first match
-
-        # If no rules matched, use default assignment
-        if not assignments:
-            default_assignment = await self._create_default_assignment(review, session)
-            if default_assignment:
-                assignments.append(default_assignment)
+            compiled.append((
+                self.evaluator.compile(conditions, rule.get("selectivity")),
+                rule.get("assign_to"),
+                rule.get("assign_to_team"),
+            ))
+            gates.append(_task_type_gate(conditions))
+
+        # Each task type's candidates keep config order, so first-match semantics hold
+        ungated = [entry for entry, gate in zip(compiled, gates) if gate is None]
+        task_types = set().union(*(gate for gate in gates if gate is not None))
+        by_task_type = {
+            task_type: [
+                entry
+                for entry, gate in zip(compiled, gates)
+                if gate is None or task_type in gate
+            ]
+            for task_type in task_types
+        }
 
-        return assignments
+        RoutingEngine._compiled_cache = (routing_rules, compiled, by_task_type, ungated)
+        return RoutingEngine._compiled_cache
 
-    async def _create_default_assignment(
-        self, review: Review, session: Session | AsyncSession
-    ) -> Optional[ReviewAssignment]:
-        """Create a default assignment using configured default reviewers.
+    def _build_default_assignment(self, review: Review) -> Optional[ReviewAssignment]:
+        """Build a default assignment using configured default reviewers.
 
         Args:
             review: Review to assign
-            session: Database session
 
         Returns:
             ReviewAssignment object or None
@@ -99,16 +245,7 @@ class RoutingEngine:
             return None
 
         # Assign to first default reviewer
-        assignment = ReviewAssignment(
+        return ReviewAssignment(
             review_id=review.id,
             reviewer_identifier=default_reviewers[0],
         )
-
-        session.add(assignment)
-
-        if isinstance(session, AsyncSession):
-            await session.flush()
-        else:
-            session.flush()
-
-        return assignment
@@ -1,5 +1,90 @@
 """Condition evaluator for routing rules."""
-from typing import Any
+import operator as _op
+import re
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+Predicate = Callable[[dict[str, Any]], bool]
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex pattern, caching the result."""
+    return re.compile(pattern)
+
+
+# Operator name -> comparison(actual, expected)
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    # Comparison operators
+    "=": _op.eq,
+    "!=": _op.ne,
+    "<": _op.lt,
+    ">": _op.gt,
+    "<=": _op.le,
+    ">=": _op.ge,
+    # String operators
+    "contains": lambda actual, expected: expected in str(actual),
+    "not_contains": lambda actual, expected: expected not in str(actual),
+    # List operators
+    "in": lambda actual, expected: actual in expected,
+    "not_in": lambda actual, expected: actual not in expected,
+    # Pattern matching
+    "matches": lambda actual, expected: bool(_compile_pattern(expected).match(str(actual))),
+}
+
+
+def _is_valid_spec(condition_spec: Any) -> bool:
+    """Check whether a condition spec can be evaluated without always raising."""
+    if not isinstance(condition_spec, dict):
+        return True
+
+    operator = condition_spec.get("operator", "=")
+    if operator not in _OPERATORS:
+        return False
+    if operator == "matches":
+        try:
+            _compile_pattern(condition_spec.get("value"))
+        except (re.error, TypeError):
+            return False
+    return True
+
+
+def _order_by_selectivity(
+    fields: list[str], conditions: dict[str, Any], selectivity: dict[str, float]
+) -> list[str]:
+    """Order ANDed fields most selective first, keeping invalid conditions in place.
+
+    Fields are only reordered between invalid conditions, so a condition that
+    evaluate() would have reached (and raised on) is still reached.
+    """
+    ordered: list[str] = []
+    run: list[str] = []
+    for field in fields:
+        if _is_valid_spec(conditions[field]):
+            run.append(field)
+            continue
+        ordered.extend(sorted(run, key=lambda f: selectivity.get(f, 1.0)))
+        ordered.append(field)
+        run = []
+    ordered.extend(sorted(run, key=lambda f: selectivity.get(f, 1.0)))
+    return ordered
+
+
+@lru_cache(maxsize=1024)
+def _split_path(field_path: str) -> tuple[str, ...]:
+    """Split a dot-separated field path, caching the result."""
+    return tuple(field_path.split("."))
+
+
+def _get_path(parts: tuple[str, ...], data: dict[str, Any]) -> Any:
+    """Walk a pre-split field path through nested dictionaries."""
+    value = data
+    for part in parts:
+        if isinstance(value, dict):
+            value = value.get(part)
+        else:
+            return None
+    return value
 
 
 class ConditionEvaluator:
@@ -57,6 +142,102 @@ class ConditionEvaluator:
 
         return True
 
+    def compile(
+        self,
+        conditions: dict[str, Any],
+        selectivity: Optional[dict[str, float]] = None,
+    ) -> Predicate:
+        """Compile conditions into a predicate over review data.
+
+        The result is equivalent to ``lambda data: self.evaluate(conditions, data)`` but
+        does the condition-tree walking and field-path splitting once, up front.
+
+        Args:
+            conditions: Dictionary of conditions to compile
+            selectivity: Optional estimated pass rate per field (0.0-1.0). Field
+                conditions that are ANDed together are checked lowest-first, so the
+                most selective one rejects non-matching reviews before the rest run.
+                Fields without an estimate keep their order after estimated ones.
+                Conditions with an invalid spec, which raise whenever their field is
+                set, stay in place so reordering never skips them; errors that depend
+                on the review data (e.g. comparing a string with a number) can still be
+                skipped when a more selective condition rejects the review first.
+
+        Returns:
+            Callable taking review data and returning True if all conditions match
+        """
+        if not conditions:
+            return lambda data: True
+
+        if "and" in conditions:
+            predicates = [self.compile(cond, selectivity) for cond in conditions["and"]]
+            return lambda data: all(predicate(data) for predicate in predicates)
+
+        if "or" in conditions:
+            predicates = [self.compile(cond, selectivity) for cond in conditions["or"]]
+            return lambda data: any(predicate(data) for predicate in predicates)
+
+        fields = [field for field in conditions if field not in ("and", "or")]
+        if selectivity:
+            fields = _order_by_selectivity(fields, conditions, selectivity)
+
+        predicates = [
+            self._compile_single_condition(field, conditions[field]) for field in fields
+        ]
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda data: all(predicate(data) for predicate in predicates)
+
+    def _compile_single_condition(self, field: str, condition_spec: Any) -> Predicate:
+        """Compile a single condition into a predicate.
+
+        Args:
+            field: Field name to check (dot notation for nested fields)
+            condition_spec: Condition specification with operator and value
+
+        Returns:
+            Callable taking review data and returning True if the condition matches
+        """
+        if "." in field:
+            parts = tuple(field.split("."))
+            get_value = lambda data: _get_path(parts, data)
+        else:
+            get_value = lambda data: data.get(field)
+
+        # If it's a simple value (not a dict), treat as equality
+        if not isinstance(condition_spec, dict):
+            return lambda data: get_value(data) == condition_spec
+
+        operator = condition_spec.get("operator", "=")
+        expected_value = condition_spec.get("value")
+
+        apply_operator = self._apply_operator
+        # Invalid specs fail at evaluation time, as evaluate() does, not while compiling
+        evaluate_lazily = lambda data: apply_operator(operator, get_value(data), expected_value)
+
+        if operator == "matches":
+            # Bake the compiled pattern into the predicate
+            try:
+                match = _compile_pattern(expected_value).match
+            except (re.error, TypeError):
+                return evaluate_lazily
+
+            def matches(data: dict[str, Any]) -> bool:
+                actual_value = get_value(data)
+                return actual_value is not None and bool(match(str(actual_value)))
+
+            return matches
+
+        apply = _OPERATORS.get(operator)
+        if apply is None:
+            return evaluate_lazily
+
+        def check(data: dict[str, Any]) -> bool:
+            actual_value = get_value(data)
+            return actual_value is not None and apply(actual_value, expected_value)
+
+        return check
+
     def _evaluate_single_condition(
         self, field: str, condition_spec: dict[str, Any], review_data: dict[str, Any]
     ) -> bool:
@@ -96,16 +277,7 @@ class ConditionEvaluator:
         Returns:
             Value at the path, or None if not found
         """
-        parts = field_path.split(".")
-        value = data
-
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
-
-        return value
+        return _get_path(_split_path(field_path), data)
 
     def _apply_operator(self, operator: str, actual: Any, expected: Any) -> bool:
         """Apply an operator to compare values.
@@ -121,36 +293,8 @@ class ConditionEvaluator:
         if actual is None:
             return False
 
-        # Comparison operators
-        if operator == "=":
-            return actual == expected
-        elif operator == "!=":
-            return actual != expected
-        elif operator == "<":
-            return actual < expected
-        elif operator == ">":
-            return actual > expected
-        elif operator == "<=":
-            return actual <= expected
-        elif operator == ">=":
-            return actual >= expected
-
-        # String operators
-        elif operator == "contains":
-            return expected in str(actual)
-        elif operator == "not_contains":
-            return expected not in str(actual)
-
-        # List operators
-        elif operator == "in":
-            return actual in expected
-        elif operator == "not_in":
-            return actual not in expected
-
-        # Pattern matching
-        elif operator == "matches":
-            import re
-            return bool(re.match(expected, str(actual)))
-
-        else:
+        apply = _OPERATORS.get(operator)
+        if apply is None:
             raise ValueError(f"Unknown operator: {operator}")
+
+        return apply(actual, expected)
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..models.decision import DecisionType
 
@@ -16,13 +16,12 @@ class DecisionCreate(BaseModel):
     reviewer_id: Optional[int] = Field(None, description="Optional reviewer ID (for tracking)")
     reviewer_name: Optional[str] = Field(None, description="Reviewer name/email identifier")
 
-    @field_validator("modified_action")
-    @classmethod
-    def validate_modified_action(cls, v: Optional[str], info) -> Optional[str]:
+    @model_validator(mode="after")
+    def validate_modified_action(self) -> "DecisionCreate":
         """Ensure modified_action is provided when decision_type is MODIFY."""
-        if info.data.get("decision_type") == DecisionType.MODIFY and not v:
+        if self.decision_type == DecisionType.MODIFY and not self.modified_action:
             raise ValueError("modified_action is required when decision_type is MODIFY")
-        return v
+        return self
 
     model_config = ConfigDict(use_enum_values=True)
 
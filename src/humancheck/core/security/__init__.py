@@ -1,8 +1,14 @@
 """Security utilities for Humancheck."""
-from .content_validator import validate_file, validate_content_type, validate_file_size
+from .content_validator import (
+    validate_file,
+    validate_file_async,
+    validate_content_type,
+    validate_file_size,
+)
 
 __all__ = [
     "validate_file",
+    "validate_file_async",
     "validate_content_type",
     "validate_file_size",
 ]
@@ -1,10 +1,12 @@
 """Content validation and security checks for file uploads."""
+import asyncio
 import hashlib
-from typing import Tuple
-
+import re
+from functools import lru_cache
+from typing import BinaryIO, Optional, Tuple, Union
 
 # Allowed content types by category
-ALLOWED_CONTENT_TYPES = {
+ALLOWED_CONTENT_TYPES = frozenset({
     # Text
     "text/plain",
     "text/markdown",
@@ -35,7 +37,30 @@ ALLOWED_CONTENT_TYPES = {
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     "application/vnd.ms-excel",
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-}
+})
+
+# Read size for streamed hashing (large enough for hashlib's SHA-NI path to run flat out)
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Read size for single-pass stream validation
+VALIDATION_CHUNK_SIZE = 64 * 1024
+
+# Bytes carried between chunks so markers split across a chunk boundary still match
+# (must be at least the longest marker length - 1)
+MARKER_OVERLAP = 16
+
+# Magic bytes of executable formats (Windows PE, Linux ELF)
+EXECUTABLE_SIGNATURES = (b"MZ", b"\x7fELF")
+
+# Script markers in images, matched case-insensitively in a single pass
+# (avoids materializing lowercased copies of the whole file)
+SCRIPT_IN_IMAGE_PATTERN = re.compile(rb"<script|javascript:", re.IGNORECASE)
+
+# Embedded JavaScript markers in PDFs
+PDF_JAVASCRIPT_PATTERN = re.compile(rb"/J(?:avaScript|S)")
+
+# Characters not allowed in sanitized filenames (path separators included)
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-.]")
 
 # Maximum file sizes by category (in bytes)
 MAX_FILE_SIZES = {
@@ -48,6 +73,12 @@ MAX_FILE_SIZES = {
 }
 
 
+@lru_cache(maxsize=256)
+def _normalize_content_type(content_type: str) -> str:
+    """Strip parameters (e.g. charset) and lowercase a MIME type."""
+    return content_type.split(";", 1)[0].strip().lower()
+
+
 def validate_content_type(content_type: str) -> Tuple[bool, str]:
     """
     Validate if content type is allowed.
@@ -62,7 +93,7 @@ def validate_content_type(content_type: str) -> Tuple[bool, str]:
         return False, "Content type is required"
 
     # Normalize content type (remove parameters like charset)
-    normalized_type = content_type.split(";")[0].strip().lower()
+    normalized_type = _normalize_content_type(content_type)
 
     if normalized_type not in ALLOWED_CONTENT_TYPES:
         return False, f"Content type not allowed: {content_type}"
@@ -94,24 +125,85 @@ def validate_file_size(file_size: int, category: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def calculate_checksum(file_data: bytes) -> str:
+def _check_size(file_size: int, category: str, max_size: Optional[int] = None) -> Tuple[bool, str]:
+    """Validate file size against a custom limit or the category default."""
+    if max_size:
+        if file_size > max_size:
+            max_mb = max_size / (1024 * 1024)
+            actual_mb = file_size / (1024 * 1024)
+            return False, f"File too large ({actual_mb:.2f} MB). Max size: {max_mb} MB"
+        return True, ""
+
+    return validate_file_size(file_size, category)
+
+
+def _marker_pattern(content_type: str) -> Optional[Tuple[re.Pattern, str]]:
+    """Get the (pattern, reason) to scan for, or None if the type isn't scanned."""
+    # Check for script content in images
+    if content_type.startswith("image/"):
+        return SCRIPT_IN_IMAGE_PATTERN, "Script content in image"
+
+    # Check for embedded executables in documents. Basic check for embedded
+    # JavaScript (PDFs can contain JS); production should use proper PDF parsing
+    if content_type == "application/pdf":
+        return PDF_JAVASCRIPT_PATTERN, "Potentially malicious PDF with JavaScript"
+
+    return None
+
+
+def checksum_backend() -> str:
+    """
+    Report which SHA256 implementation hashlib is using.
+
+    The OpenSSL-backed implementation dispatches to CPU SHA extensions (SHA-NI,
+    ARMv8 crypto) when present; the builtin fallback is several times slower.
+
+    Returns:
+        "openssl" or "builtin"
+    """
+    return "openssl" if hashlib.sha256.__name__ == "openssl_sha256" else "builtin"
+
+
+def calculate_checksum(file_data: Union[bytes, BinaryIO]) -> str:
     """
     Calculate SHA256 checksum of file.
 
     Args:
-        file_data: File content as bytes
+        file_data: File content as bytes, or a binary file-like object to stream
+
+    Returns:
+        SHA256 hexdigest
+    """
+    if isinstance(file_data, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(file_data).hexdigest()
+    return calculate_file_checksum(file_data)
+
+
+def calculate_file_checksum(file: BinaryIO, chunk_size: int = CHECKSUM_CHUNK_SIZE) -> str:
+    """
+    Calculate SHA256 checksum of a file-like object without loading it into memory.
+
+    Args:
+        file: Binary file-like object, read from its current position
+        chunk_size: Number of bytes to hash per read
 
     Returns:
         SHA256 hexdigest
     """
-    return hashlib.sha256(file_data).hexdigest()
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+: reads into one reusable buffer
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(chunk_size), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 def validate_file(
     file_data: bytes,
     declared_content_type: str,
     category: str,
-    max_size: int = None,
+    max_size: Optional[int] = None,
 ) -> Tuple[bool, str, dict]:
     """
     Complete file validation including type, size, and checksum.
@@ -133,24 +225,19 @@ def validate_file(
     # Check file size
     file_size = len(file_data)
 
-    if max_size:
-        if file_size > max_size:
-            max_mb = max_size / (1024 * 1024)
-            actual_mb = file_size / (1024 * 1024)
-            return False, f"File too large ({actual_mb:.2f} MB). Max size: {max_mb} MB", {}
-    else:
-        valid, error = validate_file_size(file_size, category)
-        if not valid:
-            return False, error, {}
-
-    # Calculate checksum
-    checksum = calculate_checksum(file_data)
+    valid, error = _check_size(file_size, category, max_size)
+    if not valid:
+        return False, error, {}
 
-    # Check for suspicious content (basic checks)
+    # Check for suspicious content (basic checks) before hashing, so rejected
+    # files are never read in full
     suspicious, reason = check_suspicious_content(file_data, declared_content_type)
     if suspicious:
         return False, f"Suspicious content detected: {reason}", {}
 
+    # Calculate checksum
+    checksum = calculate_checksum(file_data)
+
     metadata = {
         "checksum": checksum,
         "validated_size": file_size,
@@ -160,6 +247,98 @@ def validate_file(
     return True, "", metadata
 
 
+def validate_stream(
+    file: BinaryIO,
+    declared_content_type: str,
+    category: str,
+    max_size: Optional[int] = None,
+    chunk_size: int = VALIDATION_CHUNK_SIZE,
+) -> Tuple[bool, str, dict]:
+    """
+    Same checks as validate_file, in a single streaming pass over a file-like object.
+
+    Each chunk is hashed and scanned for suspicious markers as it is read, so memory
+    stays O(chunk_size) and the file is read once. The file must be seekable (its size
+    is checked before reading); it is read from its current position.
+
+    Args:
+        file: Seekable binary file-like object
+        declared_content_type: Declared MIME type
+        category: Content category
+        max_size: Optional custom max size (overrides category default)
+        chunk_size: Number of bytes to read per iteration
+
+    Returns:
+        Tuple of (is_valid, error_message, metadata_dict)
+    """
+    # Check declared content type
+    valid, error = validate_content_type(declared_content_type)
+    if not valid:
+        return False, error, {}
+
+    # Check file size without reading
+    start = file.tell()
+    file_size = file.seek(0, 2) - start
+    file.seek(start)
+
+    valid, error = _check_size(file_size, category, max_size)
+    if not valid:
+        return False, error, {}
+
+    marker_pattern = _marker_pattern(declared_content_type)
+    digest = hashlib.sha256()
+    tail = b""
+
+    chunk = file.read(chunk_size)
+    if chunk.startswith(EXECUTABLE_SIGNATURES):
+        return False, "Suspicious content detected: Executable file detected", {}
+
+    while chunk:
+        digest.update(chunk)
+
+        if marker_pattern is not None:
+            if marker_pattern[0].search(tail + chunk):
+                return False, f"Suspicious content detected: {marker_pattern[1]}", {}
+            tail = chunk[-MARKER_OVERLAP:]
+
+        chunk = file.read(chunk_size)
+
+    metadata = {
+        "checksum": digest.hexdigest(),
+        "validated_size": file_size,
+        "validated": True,
+    }
+
+    return True, "", metadata
+
+
+async def validate_file_async(
+    file_data: Union[bytes, BinaryIO],
+    declared_content_type: str,
+    category: str,
+    max_size: Optional[int] = None,
+) -> Tuple[bool, str, dict]:
+    """
+    Run validation in a worker thread so large files don't block the event loop.
+
+    hashlib releases the GIL while hashing, so other requests keep being served.
+    File-like objects are validated with validate_stream.
+
+    Args:
+        file_data: File content as bytes, or a seekable binary file-like object
+        declared_content_type: Declared MIME type
+        category: Content category
+        max_size: Optional custom max size (overrides category default)
+
+    Returns:
+        Tuple of (is_valid, error_message, metadata_dict)
+    """
+    validator = validate_file if isinstance(file_data, bytes) else validate_stream
+    return await asyncio.to_thread(
+        validator, file_data, declared_content_type, category, max_size
+    )
+
+
 def check_suspicious_content(file_data: bytes, content_type: str) -> Tuple[bool, str]:
     """
     Check for suspicious content patterns.
@@ -171,24 +350,14 @@ def check_suspicious_content(file_data: bytes, content_type: str) -> Tuple[bool,
     Returns:
         Tuple of (is_suspicious, reason)
     """
-    # Check for executable signatures
-    if file_data.startswith(b"MZ"):  # Windows executable
+    # Check for executable signatures (only looks at the first few bytes)
+    if file_data.startswith(EXECUTABLE_SIGNATURES):
         return True, "Executable file detected"
 
-    if file_data.startswith(b"\x7fELF"):  # Linux executable
-        return True, "Executable file detected"
-
-    # Check for script content in images
-    if content_type.startswith("image/"):
-        if b"<script" in file_data.lower() or b"javascript:" in file_data.lower():
-            return True, "Script content in image"
-
-    # Check for embedded executables in documents
-    if content_type == "application/pdf":
-        # Basic check for embedded JavaScript (PDFs can contain JS)
-        # This is a simple check; production should use proper PDF parsing
-        if b"/JavaScript" in file_data or b"/JS" in file_data:
-            return True, "Potentially malicious PDF with JavaScript"
+    # Check for script content in images / embedded JavaScript in PDFs
+    marker_pattern = _marker_pattern(content_type)
+    if marker_pattern is not None and marker_pattern[0].search(file_data):
+        return True, marker_pattern[1]
 
     # All checks passed
     return False, ""
@@ -204,13 +373,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import re
-
-    # Remove path separators and parent directory references
-    filename = filename.replace("..", "").replace("/", "_").replace("\\", "_")
+    # Remove parent directory references
+    filename = filename.replace("..", "")
 
-    # Remove non-alphanumeric characters except dots, dashes, and underscores
-    filename = re.sub(r"[^\w\-.]", "_", filename)
+    # Replace path separators and other non-alphanumeric characters except dots,
+    # dashes, and underscores
+    filename = UNSAFE_FILENAME_CHARS.sub("_", filename)
 
     # Limit length
     if len(filename) > 255:
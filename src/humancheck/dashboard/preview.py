@@ -1,8 +1,53 @@
 """Preview panel components for Streamlit dashboard."""
-from typing import List
+import os
+from datetime import datetime
+from typing import List, Optional
 
 import streamlit as st
 
+# Syntax highlighting language by file extension
+LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".json": "json",
+    ".md": "markdown",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".sql": "sql",
+}
+
+# Languages rendered as highlighted code
+CODE_LANGUAGES = frozenset({"python", "javascript", "java", "sql", "yaml", "json"})
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _build_metadata_display(
+    attachment_id: int,
+    checksum: Optional[str],
+    _file_name: Optional[str],
+    _content_type: str,
+    _file_size: int,
+    _uploaded_at: datetime,
+    _file_metadata: Optional[dict],
+) -> dict:
+    """Build the metadata panel contents, cached across Streamlit reruns.
+
+    Keyed by attachment ID and checksum only (underscore-prefixed args aren't hashed);
+    an attachment's stored fields don't change after upload.
+    """
+    metadata_display = {
+        "File Name": _file_name,
+        "Content Type": _content_type,
+        "File Size": f"{_file_size / 1024:.2f} KB",
+        "Uploaded": _uploaded_at.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    if checksum:
+        metadata_display["Checksum (SHA256)"] = checksum
+    if _file_metadata:
+        metadata_display.update(_file_metadata)
+
+    return metadata_display
+
 
 def render_preview_panel(attachments: List):
     """
@@ -44,16 +89,15 @@ def render_preview_panel(attachments: List):
 
     # Metadata
     with st.expander("Metadata"):
-        metadata_display = {
-            "File Name": attachment.file_name,
-            "Content Type": attachment.content_type,
-            "File Size": f"{attachment.file_size / 1024:.2f} KB",
-            "Uploaded": attachment.uploaded_at.strftime("%Y-%m-%d %H:%M:%S"),
-        }
-        if attachment.checksum:
-            metadata_display["Checksum (SHA256)"] = attachment.checksum
-        if attachment.file_metadata:
-            metadata_display.update(attachment.file_metadata)
+        metadata_display = _build_metadata_display(
+            attachment.id,
+            attachment.checksum,
+            attachment.file_name,
+            attachment.content_type,
+            attachment.file_size,
+            attachment.uploaded_at,
+            attachment.file_metadata,
+        )
 
         st.json(metadata_display)
 
@@ -75,21 +119,11 @@ def render_text_preview(attachment):
 
     # Try to detect from filename
     if attachment.file_name:
-        if attachment.file_name.endswith(".py"):
-            language = "python"
-        elif attachment.file_name.endswith(".js"):
-            language = "javascript"
-        elif attachment.file_name.endswith(".json"):
-            language = "json"
-        elif attachment.file_name.endswith(".md"):
-            language = "markdown"
-        elif attachment.file_name.endswith(".yaml") or attachment.file_name.endswith(".yml"):
-            language = "yaml"
-        elif attachment.file_name.endswith(".sql"):
-            language = "sql"
+        extension = os.path.splitext(attachment.file_name)[1].lower()
+        language = LANGUAGE_BY_EXTENSION.get(extension, language)
 
     # Determine if code or markdown
-    if language in ["python", "javascript", "java", "sql", "yaml", "json"]:
+    if language in CODE_LANGUAGES:
         st.code(content, language=language)
     elif language == "markdown":
         st.markdown(content)
@@ -4,12 +4,20 @@ This MCP server provides tools for Claude Desktop and other MCP clients
 to request human review, check status, get decisions, and submit feedback.
 """
 import asyncio
+import inspect
+import json
 import logging
 from typing import Any
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
+from sqlalchemy import text
+
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
 
 from .core.config.settings import get_config, init_config
 from .core.storage.database import init_db
@@ -25,167 +33,200 @@ logger = logging.getLogger(__name__)
 app = Server("humancheck")
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MCP tools."""
-    return [
-        Tool(
-            name="request_review",
-            description=(
-                "Request human review for an AI agent decision. "
-                "Use this when you need human oversight for uncertain or high-stakes actions "
-                "like payments, data deletion, compliance decisions, etc."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_type": {
-                        "type": "string",
-                        "description": "Type of task (e.g., 'payment', 'data_deletion', 'content_moderation')",
-                    },
-                    "proposed_action": {
-                        "type": "string",
-                        "description": "The action you want to take",
-                    },
-                    "reasoning": {
-                        "type": "string",
-                        "description": "Your reasoning for the proposed action",
-                    },
-                    "confidence": {
-                        "type": "number",
-                        "description": "Confidence score (0-1) for the proposed action",
-                        "minimum": 0,
-                        "maximum": 1,
-                    },
-                    "urgency": {
-                        "type": "string",
-                        "description": "Urgency level",
-                        "enum": ["low", "medium", "high", "critical"],
-                        "default": "medium",
-                    },
-                    "blocking": {
-                        "type": "boolean",
-                        "description": "Whether to wait for decision (default: false)",
-                        "default": False,
-                    },
-                    "metadata": {
-                        "type": "object",
-                        "description": "Additional metadata as JSON",
-                    },
-                    "organization_id": {
-                        "type": "integer",
-                        "description": "Organization ID for multi-tenancy",
-                    },
-                    "agent_id": {
-                        "type": "integer",
-                        "description": "Agent ID",
-                    },
+# Tool definitions are static; build them once instead of on every tools/list
+_TOOLS: list[Tool] = [
+    Tool(
+        name="request_review",
+        description=(
+            "Request human review for an AI agent decision. "
+            "Use this when you need human oversight for uncertain or high-stakes actions "
+            "like payments, data deletion, compliance decisions, etc."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "task_type": {
+                    "type": "string",
+                    "description": "Type of task (e.g., 'payment', 'data_deletion', 'content_moderation')",
+                },
+                "proposed_action": {
+                    "type": "string",
+                    "description": "The action you want to take",
+                },
+                "reasoning": {
+                    "type": "string",
+                    "description": "Your reasoning for the proposed action",
+                },
+                "confidence": {
+                    "type": "number",
+                    "description": "Confidence score (0-1) for the proposed action",
+                    "minimum": 0,
+                    "maximum": 1,
+                },
+                "urgency": {
+                    "type": "string",
+                    "description": "Urgency level",
+                    "enum": ["low", "medium", "high", "critical"],
+                    "default": "medium",
+                },
+                "blocking": {
+                    "type": "boolean",
+                    "description": "Whether to wait for decision (default: false)",
+                    "default": False,
+                },
+                "metadata": {
+                    "type": "object",
+                    "description": "Additional metadata as JSON",
+                },
+                "organization_id": {
+                    "type": "integer",
+                    "description": "Organization ID for multi-tenancy",
+                },
+                "agent_id": {
+                    "type": "integer",
+                    "description": "Agent ID",
                 },
-                "required": ["task_type", "proposed_action"],
             },
-        ),
-        Tool(
-            name="check_review_status",
-            description="Check the status of a review request",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "review_id": {
-                        "type": "integer",
-                        "description": "ID of the review to check",
-                    },
+            "required": ["task_type", "proposed_action"],
+        },
+    ),
+    Tool(
+        name="check_review_status",
+        description="Check the status of a review request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "review_id": {
+                    "type": "integer",
+                    "description": "ID of the review to check",
                 },
-                "required": ["review_id"],
             },
-        ),
-        Tool(
-            name="get_review_decision",
-            description="Get the decision for a completed review",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "review_id": {
-                        "type": "integer",
-                        "description": "ID of the review",
-                    },
+            "required": ["review_id"],
+        },
+    ),
+    Tool(
+        name="get_review_decision",
+        description="Get the decision for a completed review",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "review_id": {
+                    "type": "integer",
+                    "description": "ID of the review",
                 },
-                "required": ["review_id"],
             },
+            "required": ["review_id"],
+        },
+    ),
+    Tool(
+        name="submit_feedback",
+        description=(
+            "Submit feedback on a review/decision to help improve the review process. "
+            "Provide a rating (1-5) and/or comment."
         ),
-        Tool(
-            name="submit_feedback",
-            description=(
-                "Submit feedback on a review/decision to help improve the review process. "
-                "Provide a rating (1-5) and/or comment."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "review_id": {
-                        "type": "integer",
-                        "description": "ID of the review to provide feedback for",
-                    },
-                    "rating": {
-                        "type": "integer",
-                        "description": "Rating from 1-5",
-                        "minimum": 1,
-                        "maximum": 5,
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Feedback comment",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "review_id": {
+                    "type": "integer",
+                    "description": "ID of the review to provide feedback for",
+                },
+                "rating": {
+                    "type": "integer",
+                    "description": "Rating from 1-5",
+                    "minimum": 1,
+                    "maximum": 5,
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Feedback comment",
                 },
-                "required": ["review_id"],
             },
-        ),
-    ]
+            "required": ["review_id"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools."""
+    return _TOOLS
+
+
+def _dumps_result(result: Any) -> str:
+    """Serialize a tool result as indented JSON, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC).decode()
+    return json.dumps(result, indent=2)
+
+
+# Tool name -> handler. Handler signatures mirror the tool input schemas above.
+_TOOL_HANDLERS = {
+    "request_review": request_review,
+    "check_review_status": check_review_status,
+    "get_review_decision": get_review_decision,
+    "submit_feedback": submit_feedback,
+}
+
+# Tool name -> argument names its handler accepts. Clients may send extra keys (e.g.
+# from a newer schema); those are dropped rather than failing the call.
+_TOOL_PARAMETERS = {
+    name: frozenset(inspect.signature(handler).parameters)
+    for name, handler in _TOOL_HANDLERS.items()
+}
+
+
+def _handler_arguments(name: str, arguments: Any) -> dict[str, Any]:
+    """Keep only the arguments the tool's handler accepts."""
+    accepted = _TOOL_PARAMETERS[name]
+    return {key: value for key, value in (arguments or {}).items() if key in accepted}
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls from MCP clients."""
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
     try:
-        if name == "request_review":
-            result = await request_review(
-                task_type=arguments["task_type"],
-                proposed_action=arguments["proposed_action"],
-                reasoning=arguments.get("reasoning"),
-                confidence=arguments.get("confidence"),
-                urgency=arguments.get("urgency", "medium"),
-                blocking=arguments.get("blocking", False),
-                metadata=arguments.get("metadata"),
-                organization_id=arguments.get("organization_id"),
-                agent_id=arguments.get("agent_id"),
-            )
-        elif name == "check_review_status":
-            result = await check_review_status(arguments["review_id"])
-        elif name == "get_review_decision":
-            result = await get_review_decision(arguments["review_id"])
-        elif name == "submit_feedback":
-            result = await submit_feedback(
-                review_id=arguments["review_id"],
-                rating=arguments.get("rating"),
-                comment=arguments.get("comment"),
-            )
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        result = await handler(**_handler_arguments(name, arguments))
 
         # Format result as JSON string
-        import json
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [TextContent(type="text", text=_dumps_result(result))]
 
     except Exception as e:
         logger.error(f"Error calling tool {name}: {e}", exc_info=True)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+async def _warm_pool(db, size: int) -> None:
+    """Open pooled connections up front so the first tool calls don't pay for them.
+
+    Args:
+        db: Database instance
+        size: Number of connections to open concurrently
+    """
+
+    async def _ping() -> None:
+        async with db.session() as session:
+            await session.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(_ping() for _ in range(size)), return_exceptions=True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        logger.warning(f"Connection pool warm-up: {len(failures)}/{size} failed: {failures[0]}")
+
+
 async def run_mcp_server():
     """Run the MCP server."""
     # Initialize configuration and database
     config = init_config()
     db = init_db(config.get_database_url())
     await db.create_tables()
+    if not config.get_database_url().startswith("sqlite"):
+        await _warm_pool(db, db.engine.pool.size())
 
     logger.info(f"Starting Humancheck MCP server: {config.mcp_server_name}")
     logger.info(f"Database: {config.get_database_url()}")
@@ -203,8 +244,15 @@ def main():
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
-    # Run the server
-    asyncio.run(run_mcp_server())
+    # Run the server on uvloop's event loop when it's installed (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if uvloop is not None:
+        uvloop.run(run_mcp_server())
+    else:
+        asyncio.run(run_mcp_server())
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 """MCP tools package."""
 from .check_status import check_review_status
-from .get_decision import get_review_decision
-from .request_review import request_review
+from .get_decision import get_review_decision, invalidate_decision_cache
+from .request_review import request_review, request_reviews_bulk
 from .submit_feedback import submit_feedback
 
 __all__ = [
     "request_review",
+    "request_reviews_bulk",
     "check_review_status",
     "get_review_decision",
+    "invalidate_decision_cache",
     "submit_feedback",
 ]
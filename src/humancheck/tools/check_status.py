@@ -24,6 +24,13 @@ async def check_review_status(review_id: int) -> dict[str, Any]:
         >>> #   ...
         >>> # }
     """
+    # Reject malformed IDs before checking out a connection
+    if type(review_id) is not int or review_id <= 0:
+        return {
+            "error": "Invalid review_id",
+            "review_id": review_id,
+        }
+
     db = get_db()
 
     async with db.session() as session:
@@ -1,9 +1,59 @@
 """MCP tool for getting review decision."""
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
-from ..core.adapters import McpAdapter
+from ..core.adapters import UniversalReview
+from ..core.adapters.decision_events import add_decision_listener
+from ..core.adapters.mcp_adapter import get_mcp_adapter
 from ..core.storage.database import get_db
-from ..core.models import Decision, Review, UrgencyLevel
+from ..core.models import Review
+
+# Responses for decided reviews don't change, so they're cached briefly to spare the
+# database on repeated polling; decisions made in another process can't invalidate
+# this cache, which is what the TTL is for
+DECISION_CACHE_TTL = 60.0
+DECISION_CACHE_SIZE = 1024
+_decision_cache: "OrderedDict[int, tuple[float, dict[str, Any]]]" = OrderedDict()
+
+
+def _get_cached_response(review_id: int) -> Optional[dict[str, Any]]:
+    """Get a copy of a cached decision response if it hasn't expired."""
+    entry = _decision_cache.get(review_id)
+    if entry is None:
+        return None
+
+    expires_at, response = entry
+    if expires_at <= time.monotonic():
+        del _decision_cache[review_id]
+        return None
+
+    _decision_cache.move_to_end(review_id)
+    return dict(response)
+
+
+def _cache_response(review_id: int, response: dict[str, Any]) -> None:
+    """Cache a decision response, evicting the least recently used past the size limit."""
+    _decision_cache[review_id] = (time.monotonic() + DECISION_CACHE_TTL, dict(response))
+    _decision_cache.move_to_end(review_id)
+    while len(_decision_cache) > DECISION_CACHE_SIZE:
+        _decision_cache.popitem(last=False)
+
+
+def invalidate_decision_cache(review_id: Optional[int] = None) -> None:
+    """Drop a cached decision response, or all of them.
+
+    Args:
+        review_id: Review to drop, or None to clear the whole cache
+    """
+    if review_id is None:
+        _decision_cache.clear()
+    else:
+        _decision_cache.pop(review_id, None)
+
+
+# Decisions made in this process drop their cached response right away
+add_decision_listener(invalidate_decision_cache)
 
 
 async def get_review_decision(review_id: int) -> dict[str, Any]:
@@ -40,6 +90,17 @@ async def get_review_decision(review_id: int) -> dict[str, Any]:
         >>> #   ...
         >>> # }
     """
+    # Reject malformed IDs before touching the cache or the connection pool
+    if type(review_id) is not int or review_id <= 0:
+        return {
+            "error": "Invalid review_id",
+            "review_id": review_id,
+        }
+
+    cached = _get_cached_response(review_id)
+    if cached is not None:
+        return cached
+
     db = get_db()
 
     async with db.session() as session:
@@ -59,8 +120,8 @@ async def get_review_decision(review_id: int) -> dict[str, Any]:
                 "message": "No decision has been made yet. The review is still pending.",
             }
 
-        # Get the decision
-        decision = await session.get(Decision, review_id)
+        # Decision is joined in with the review
+        decision = review.decision
         if not decision:
             return {
                 "review_id": review_id,
@@ -68,24 +129,12 @@ async def get_review_decision(review_id: int) -> dict[str, Any]:
                 "error": "Review is marked as decided but decision not found",
             }
 
-        # Use MCP adapter to format the response
-        adapter = McpAdapter(db.session)
-
-        from ..core.adapters import UniversalReview
-
-        universal_review = UniversalReview(
-            task_type=review.task_type,
-            proposed_action=review.proposed_action,
-            agent_reasoning=review.agent_reasoning,
-            confidence_score=review.confidence_score,
-            urgency=UrgencyLevel(review.urgency),
-            framework=review.framework,
-            metadata=review.meta_data,
-            organization_id=review.organization_id,
-            agent_id=review.agent_id,
-        )
+    # Everything needed is loaded; format the response without holding the session
+    adapter = get_mcp_adapter(db)
+    universal_review = UniversalReview.from_review(review)
 
-        response = adapter.from_universal(universal_review, decision)
-        response["review_id"] = review_id
+    response = adapter.from_universal(universal_review, decision)
+    response["review_id"] = review_id
+    _cache_response(review_id, response)
 
-        return response
+    return response
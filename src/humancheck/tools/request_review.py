@@ -2,11 +2,26 @@
 from typing import Any, Optional
 
 from ..core.adapters import McpAdapter, UniversalReview
+from ..core.adapters.mcp_adapter import get_mcp_adapter
 from ..core.config.settings import get_config
 from ..core.storage.database import get_db
 from ..core.models import Review, ReviewStatus, UrgencyLevel
 from ..core.routing import RoutingEngine
 
+_URGENCY_VALUES = [level.value for level in UrgencyLevel]
+_VALID_URGENCY = frozenset(_URGENCY_VALUES)
+
+# Shared across calls; rebuilt if the configuration is replaced
+_routing_engine: Optional[RoutingEngine] = None
+
+
+def _get_routing_engine() -> RoutingEngine:
+    """Get the routing engine, reusing it across calls."""
+    global _routing_engine
+    if _routing_engine is None or _routing_engine.config is not get_config():
+        _routing_engine = RoutingEngine()
+    return _routing_engine
+
 
 async def request_review(
     task_type: str,
@@ -63,57 +78,33 @@ async def request_review(
     db = get_db()
     config = get_config()
 
-    # Validate urgency
-    valid_urgency = ["low", "medium", "high", "critical"]
-    if urgency not in valid_urgency:
-        raise ValueError(f"Invalid urgency. Must be one of: {valid_urgency}")
-
-    # Validate confidence if provided
-    if confidence is not None and (confidence < 0 or confidence > 1):
-        raise ValueError("confidence must be between 0 and 1")
-
     # Create review using MCP adapter
-    adapter = McpAdapter(db.session)
-
-    request_data = {
-        "task_type": task_type,
-        "proposed_action": proposed_action,
-        "reasoning": reasoning,
-        "confidence": confidence,
-        "urgency": urgency,
-        "blocking": blocking,
-        "metadata": metadata,
-        "organization_id": organization_id,
-        "agent_id": agent_id,
-    }
-
-    # Validate request
-    await adapter.validate_request(request_data)
-
-    # Convert to UniversalReview
-    universal_review = adapter.to_universal(request_data)
+    adapter = get_mcp_adapter(db)
+
+    universal_review = await _prepare_review(
+        adapter,
+        {
+            "task_type": task_type,
+            "proposed_action": proposed_action,
+            "reasoning": reasoning,
+            "confidence": confidence,
+            "urgency": urgency,
+            "blocking": blocking,
+            "metadata": metadata,
+            "organization_id": organization_id,
+            "agent_id": agent_id,
+        },
+    )
 
     # Create review in database
     async with db.session() as session:
-        review = Review(
-            task_type=universal_review.task_type,
-            proposed_action=universal_review.proposed_action,
-            agent_reasoning=universal_review.agent_reasoning,
-            confidence_score=universal_review.confidence_score,
-            urgency=universal_review.urgency.value,
-            framework=universal_review.framework,
-            metadata=universal_review.metadata,
-            organization_id=universal_review.organization_id,
-            agent_id=universal_review.agent_id,
-            status=ReviewStatus.PENDING.value,
-        )
+        review = _build_review(universal_review)
 
         session.add(review)
         await session.flush()
 
         # Route the review
-        routing_engine = RoutingEngine()
-        await routing_engine.route_review(review, session)
+        await _get_routing_engine().route_review(review, session)
 
         await session.commit()
 
@@ -140,3 +131,101 @@ async def request_review(
         "task_type": task_type,
         "urgency": urgency,
     }
+
+
+async def request_reviews_bulk(requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Request human review for many AI agent decisions at once.
+
+    All reviews are inserted with a single flush and routed with one bulk insert,
+    then committed together. Requests are non-blocking; ``blocking`` is ignored.
+
+    Args:
+        requests: Review requests, each with the same keys as request_review's arguments
+
+    Returns:
+        List of dictionaries with review ID and status, in request order
+
+    Raises:
+        ValueError: If any request is invalid (nothing is created in that case)
+    """
+    db = get_db()
+    adapter = get_mcp_adapter(db)
+
+    universal_reviews = [
+        await _prepare_review(adapter, {"urgency": "medium", **request})
+        for request in requests
+    ]
+
+    async with db.session() as session:
+        reviews = [_build_review(universal_review) for universal_review in universal_reviews]
+        session.add_all(reviews)
+        await session.flush()
+
+        await _get_routing_engine().route_reviews_bulk(reviews, session)
+
+        results = [
+            {
+                "review_id": review.id,
+                "status": "pending",
+                "task_type": review.task_type,
+                "urgency": review.urgency,
+            }
+            for review in reviews
+        ]
+
+        await session.commit()
+
+    return results
+
+
+async def _prepare_review(adapter: McpAdapter, request_data: dict[str, Any]) -> UniversalReview:
+    """Validate a review request and convert it to a UniversalReview.
+
+    Args:
+        adapter: MCP adapter
+        request_data: Request fields as passed to request_review
+
+    Returns:
+        UniversalReview for the request
+
+    Raises:
+        ValueError: If urgency or confidence is invalid
+    """
+    # Validate urgency
+    urgency = request_data.get("urgency")
+    if urgency not in _VALID_URGENCY:
+        raise ValueError(f"Invalid urgency. Must be one of: {_URGENCY_VALUES}")
+
+    # Validate confidence if provided
+    confidence = request_data.get("confidence")
+    if confidence is not None and (confidence < 0 or confidence > 1):
+        raise ValueError("confidence must be between 0 and 1")
+
+    # Validate request
+    await adapter.validate_request(request_data)
+
+    # Convert to UniversalReview
+    return adapter.to_universal(request_data)
+
+
+def _build_review(universal_review: UniversalReview) -> Review:
+    """Build a pending Review from a UniversalReview.
+
+    Reviews have no organization/agent columns, so those IDs are kept in the metadata.
+    """
+    metadata = dict(universal_review.metadata or {})
+    if universal_review.organization_id is not None:
+        metadata["organization_id"] = universal_review.organization_id
+    if universal_review.agent_id is not None:
+        metadata["agent_id"] = universal_review.agent_id
+
+    return Review(
+        task_type=universal_review.task_type,
+        proposed_action=universal_review.proposed_action,
+        agent_reasoning=universal_review.agent_reasoning,
+        confidence_score=universal_review.confidence_score,
+        urgency=universal_review.urgency.value,
+        framework=universal_review.framework,
+        meta_data=metadata or universal_review.metadata,
+        status=ReviewStatus.PENDING.value,
+    )
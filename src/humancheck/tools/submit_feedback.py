@@ -1,9 +1,29 @@
 """MCP tool for submitting feedback on reviews."""
+from datetime import datetime, timezone
 from typing import Any, Optional
 
+from sqlalchemy import DateTime, Integer, Text, bindparam, exists, insert, select
+
 from ..core.storage.database import get_db
 from ..core.models import Feedback, Review
 
+# Built once at import; per call only the bound values change, so the engine's compiled
+# cache hits on the same statement object every time
+_review_id_param = bindparam("review_id", type_=Integer)
+_INSERT_FEEDBACK = (
+    insert(Feedback)
+    .from_select(
+        ["review_id", "rating", "comment", "timestamp"],
+        select(
+            _review_id_param,
+            bindparam("rating", type_=Integer),
+            bindparam("comment", type_=Text),
+            bindparam("timestamp", type_=DateTime(timezone=True)),
+        ).where(exists().where(Review.id == _review_id_param)),
+    )
+    .returning(Feedback.id)
+)
+
 
 async def submit_feedback(
     review_id: int,
@@ -43,6 +63,14 @@ async def submit_feedback(
         ...     comment="The modified action worked perfectly"
         ... )
     """
+    # Reject malformed IDs before checking out a connection
+    if type(review_id) is not int or review_id <= 0:
+        return {
+            "success": False,
+            "error": "Invalid review_id",
+            "review_id": review_id,
+        }
+
     # Validate rating if provided
     if rating is not None and (rating < 1 or rating > 5):
         return {
@@ -60,23 +88,24 @@ async def submit_feedback(
     db = get_db()
 
     async with db.session() as session:
-        # Verify review exists
-        review = await session.get(Review, review_id)
-        if not review:
+        # Insert only if the review exists: one round trip instead of a get plus an insert
+        result = await session.execute(
+            _INSERT_FEEDBACK,
+            {
+                "review_id": review_id,
+                "rating": rating,
+                "comment": comment,
+                "timestamp": datetime.now(timezone.utc),
+            },
+        )
+        feedback_id = result.scalar()
+        if feedback_id is None:
             return {
                 "success": False,
                 "error": "Review not found",
                 "review_id": review_id,
             }
 
-        # Create feedback
-        feedback = Feedback(
-            review_id=review_id,
-            rating=rating,
-            comment=comment,
-        )
-
-        session.add(feedback)
         await session.commit()
 
         return {
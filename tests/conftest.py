@@ -2,6 +2,11 @@
 import asyncio
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from humancheck.core.config.settings import HumancheckConfig, init_config
+from humancheck.core.storage.database import Database, init_db
 
 
 @pytest.fixture(scope="session")
@@ -10,3 +15,63 @@ def event_loop():
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Keep temporary tables and indices in memory, like the database itself."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Stop the driver from issuing its own BEGIN, so SAVEPOINTs nest properly."""
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(connection):
+    """Start transactions explicitly now that the driver no longer does."""
+    connection.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
+def config() -> HumancheckConfig:
+    """Load the test configuration once per test run, using an in-memory database."""
+    config = init_config()
+    config.db_url = "sqlite+aiosqlite://"
+    return config
+
+
+@pytest.fixture(scope="session")
+async def db(config: HumancheckConfig):
+    """Create the in-memory test database and its schema once per test run."""
+    db = init_db(config.get_database_url())
+    event.listen(db.engine.sync_engine, "connect", _set_sqlite_pragmas)
+    # SQLAlchemy's recipe for SAVEPOINT support on pysqlite (and aiosqlite): without it,
+    # the session fixture's rollback doesn't undo what tests commit
+    event.listen(db.engine.sync_engine, "connect", _disable_pysqlite_transactions)
+    event.listen(db.engine.sync_engine, "begin", _emit_begin)
+    await db.create_tables()
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+async def session(db: Database):
+    """Create a test session whose changes are rolled back after the test.
+
+    The session is bound to a connection inside an outer transaction, and its commits
+    only release savepoints, so every test starts from the same empty tables.
+    """
+    async with db.engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
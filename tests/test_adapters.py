@@ -0,0 +1,52 @@
+"""Tests for the framework adapters' blocking wait."""
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from humancheck.core.adapters import McpAdapter, RestAdapter
+from humancheck.core.adapters.decision_events import notify_decision
+from humancheck.core.models import Decision, DecisionType, Review, ReviewStatus
+
+
+@pytest.mark.parametrize("adapter_class", [McpAdapter, RestAdapter])
+async def test_handle_blocking_returns_decision_made_mid_wait(
+    session: AsyncSession, adapter_class
+):
+    """A blocked request wakes on the decision and reports it with the review's IDs."""
+    review = Review(
+        task_type="payment",
+        proposed_action="Process payment of $5,000",
+        urgency="high",
+        meta_data={"organization_id": 1, "agent_id": 2},
+    )
+    session.add(review)
+    await session.flush()
+    review_id = review.id
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    adapter = adapter_class(session_factory)
+    blocked = asyncio.create_task(adapter.handle_blocking(review_id, timeout=30))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    review.status = ReviewStatus.APPROVED.value
+    session.add(Decision(review_id=review_id, decision_type=DecisionType.APPROVE.value))
+    await session.flush()
+    session.expire(review)
+    notify_decision(review_id)
+
+    # Well inside the poll interval, so this only passes if the decision woke the wait
+    response = await asyncio.wait_for(blocked, timeout=0.5)
+
+    assert response["status"] == "completed"
+    if adapter_class is McpAdapter:
+        assert response["result"] == "approved"
+    else:
+        assert response["decision_type"] == DecisionType.APPROVE.value
+        assert response["review"]["organization_id"] == 1
+        assert response["review"]["agent_id"] == 2
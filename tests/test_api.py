@@ -1,29 +1,56 @@
 """Tests for the Humancheck REST API."""
+import asyncio
+from types import MappingProxyType
+
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from humancheck.api import app
-from humancheck.core.config.settings import init_config
-from humancheck.core.storage.database import init_db
+from humancheck.api.dependencies import get_session
+from humancheck.core.adapters.decision_events import wait_for_decision
+
+# Default payload for reviews created by the tests; copy it before changing fields
+BASE_REVIEW = MappingProxyType({
+    "task_type": "test",
+    "proposed_action": "Test action",
+    "urgency": "medium",
+})
+
+
+@pytest.fixture(scope="module")
+async def asgi_client():
+    """Create one ASGI transport and client for all tests in this module."""
+    transport = ASGITransport(app=app)
+    # In-process app: no proxy/env lookups or timeouts to configure per request
+    async with AsyncClient(
+        transport=transport, base_url="http://test", trust_env=False, timeout=None
+    ) as ac:
+        yield ac
 
 
 @pytest.fixture
-async def client():
-    """Create test client with in-memory database."""
-    # Use in-memory SQLite for tests
-    config = init_config()
-    config.db_path = ":memory:"
+async def client(asgi_client: AsyncClient, session: AsyncSession):
+    """Get the test client, with its requests sharing the rolled-back test session."""
+    async def override_get_session():
+        yield session
 
-    db = init_db(config.get_database_url())
-    await db.create_tables()
+    app.dependency_overrides[get_session] = override_get_session
+    yield asgi_client
+    app.dependency_overrides.pop(get_session, None)
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
 
-    await db.close()
+@pytest.fixture
+def make_review(client: AsyncClient):
+    """Get a factory that creates a review through the API and returns its JSON."""
+    async def _make_review(**overrides):
+        response = await client.post("/reviews", json={**BASE_REVIEW, **overrides})
+        assert response.status_code == 201
+        return response.json()
+
+    return _make_review
 
 
-@pytest.mark.asyncio
 async def test_health_check(client):
     """Test the health check endpoint."""
     response = await client.get("/health")
@@ -33,7 +60,6 @@ async def test_health_check(client):
     assert data["service"] == "humancheck"
 
 
-@pytest.mark.asyncio
 async def test_create_review(client):
     """Test creating a review request."""
     review_data = {
@@ -56,16 +82,10 @@ async def test_create_review(client):
     assert "id" in data
 
 
-@pytest.mark.asyncio
-async def test_list_reviews(client):
+async def test_list_reviews(client, make_review):
     """Test listing reviews."""
     # Create a review first
-    review_data = {
-        "task_type": "test",
-        "proposed_action": "Test action",
-        "urgency": "low",
-    }
-    await client.post("/reviews", json=review_data)
+    await make_review(urgency="low")
 
     # List reviews
     response = await client.get("/reviews")
@@ -77,17 +97,10 @@ async def test_list_reviews(client):
     assert data["total"] >= 1
 
 
-@pytest.mark.asyncio
-async def test_get_review(client):
+async def test_get_review(client, make_review):
     """Test getting a specific review."""
     # Create a review
-    review_data = {
-        "task_type": "test",
-        "proposed_action": "Test action",
-        "urgency": "medium",
-    }
-    create_response = await client.post("/reviews", json=review_data)
-    review_id = create_response.json()["id"]
+    review_id = (await make_review())["id"]
 
     # Get the review
     response = await client.get(f"/reviews/{review_id}")
@@ -98,17 +111,10 @@ async def test_get_review(client):
     assert data["task_type"] == "test"
 
 
-@pytest.mark.asyncio
-async def test_create_decision(client):
+async def test_create_decision(client, make_review):
     """Test creating a decision for a review."""
     # Create a review
-    review_data = {
-        "task_type": "test",
-        "proposed_action": "Test action",
-        "urgency": "medium",
-    }
-    create_response = await client.post("/reviews", json=review_data)
-    review_id = create_response.json()["id"]
+    review_id = (await make_review())["id"]
 
     # Create decision
     decision_data = {
@@ -124,17 +130,22 @@ async def test_create_decision(client):
     assert data["notes"] == "Looks good!"
 
 
-@pytest.mark.asyncio
-async def test_submit_feedback(client):
+async def test_decision_wakes_blocked_waiter(client, make_review):
+    """A request blocked on a review returns as soon as the decision is made."""
+    review_id = (await make_review())["id"]
+    waiter = asyncio.create_task(wait_for_decision(review_id, timeout=30))
+    await asyncio.sleep(0)  # let the waiter start waiting
+
+    response = await client.post(f"/reviews/{review_id}/decide", json={"decision_type": "reject"})
+    assert response.status_code == 200
+
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+
+
+async def test_submit_feedback(client, make_review):
     """Test submitting feedback on a review."""
     # Create a review
-    review_data = {
-        "task_type": "test",
-        "proposed_action": "Test action",
-        "urgency": "medium",
-    }
-    create_response = await client.post("/reviews", json=review_data)
-    review_id = create_response.json()["id"]
+    review_id = (await make_review())["id"]
 
     # Submit feedback
     feedback_data = {
@@ -149,17 +160,14 @@ async def test_submit_feedback(client):
     assert data["rating"] == 5
 
 
-@pytest.mark.asyncio
-async def test_get_statistics(client):
+async def test_get_statistics(client, make_review):
     """Test getting review statistics."""
     # Create some reviews
     for i in range(3):
-        await client.post("/reviews", json={
-            "task_type": "test",
-            "proposed_action": f"Test action {i}",
-            "urgency": "medium",
-            "confidence_score": 0.8 + (i * 0.05),
-        })
+        await make_review(
+            proposed_action=f"Test action {i}",
+            confidence_score=0.8 + (i * 0.05),
+        )
 
     # Get statistics
     response = await client.get("/stats")
@@ -171,17 +179,10 @@ async def test_get_statistics(client):
     assert "task_type_breakdown" in data
 
 
-@pytest.mark.asyncio
-async def test_filter_reviews_by_status(client):
+async def test_filter_reviews_by_status(client, make_review):
     """Test filtering reviews by status."""
     # Create and approve a review
-    review_data = {
-        "task_type": "test",
-        "proposed_action": "Test action",
-        "urgency": "medium",
-    }
-    create_response = await client.post("/reviews", json=review_data)
-    review_id = create_response.json()["id"]
+    review_id = (await make_review())["id"]
 
     await client.post(f"/reviews/{review_id}/decide", json={
         "decision_type": "approve"
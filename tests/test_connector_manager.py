@@ -0,0 +1,137 @@
+"""Tests for connector notification logging and in-place updates."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from humancheck.core.integrations.base import ReviewConnector
+from humancheck.core.integrations.manager import (
+    ConnectorManager,
+    _cache_connector,
+    invalidate_connector_cache,
+)
+from humancheck.core.models import (
+    ConnectorConfig,
+    Decision,
+    DecisionType,
+    NotificationLog,
+    Review,
+    ReviewStatus,
+    UrgencyLevel,
+)
+
+
+class FakeConnector(ReviewConnector):
+    """Connector that delivers to some recipients and records message updates."""
+
+    def __init__(self, delivered: dict[str, tuple[str, str]]):
+        super().__init__({})
+        self.delivered = delivered  # recipient -> (message_id, channel)
+        self.updates = []
+
+    def _get_connector_type(self) -> str:
+        return "fake"
+
+    async def _send(self, recipients):
+        results = [
+            {"recipient": r, "message_id": self.delivered[r][0], "channel": self.delivered[r][1]}
+            for r in recipients
+            if r in self.delivered
+        ]
+        if not results:
+            return {"success": False, "error": "No messages sent successfully"}
+        return {"success": True, "message_id": results[0]["message_id"], "results": results}
+
+    async def send_review_notification(self, review, recipients, additional_context=None):
+        return await self._send(recipients)
+
+    async def send_decision_notification(self, review, decision, recipients):
+        return await self._send(recipients)
+
+    async def update_notification(self, message_id, review, decision=None, channel=None):
+        self.updates.append((message_id, channel))
+        return {"success": True, "message_id": message_id, "channel": channel}
+
+    async def test_connection(self):
+        return {"success": True, "message": "ok"}
+
+
+class FixedRoutes:
+    """Routing stand-in that sends every review to the same recipients."""
+
+    def __init__(self, config: ConnectorConfig, recipients: list[str]):
+        self.routes = [(config, recipients)]
+
+    async def route_review(self, review, session):
+        return self.routes
+
+
+@pytest.fixture
+async def review(session: AsyncSession) -> Review:
+    """Create a pending review."""
+    review = Review(
+        task_type="test",
+        proposed_action="Test action",
+        urgency=UrgencyLevel.MEDIUM.value,
+        status=ReviewStatus.PENDING.value,
+    )
+    session.add(review)
+    await session.flush()
+    return review
+
+
+@pytest.fixture
+async def connector(session: AsyncSession):
+    """Register a fake connector that only reaches #a."""
+    config = ConnectorConfig(connector_type="fake", name="fake", config_data={}, enabled=True)
+    session.add(config)
+    await session.flush()
+
+    connector = FakeConnector({"#a": ("1.1", "C1")})
+    _cache_connector(config.id, connector)
+    yield config, connector
+    invalidate_connector_cache()
+
+
+async def test_partial_send_logs_each_recipients_own_outcome(
+    session: AsyncSession, review: Review, connector
+):
+    """A recipient that wasn't reached is logged as failed, without another's message ID."""
+    config, _ = connector
+    manager = ConnectorManager(session)
+    manager.routing_engine = FixedRoutes(config, ["#a", "#b"])
+
+    logs = await manager.send_review_notification(review)
+
+    by_recipient = {log.recipient: log for log in logs}
+    assert by_recipient["#a"].status == "sent"
+    assert by_recipient["#a"].message_id == "1.1"
+    assert by_recipient["#a"].notification_metadata["channel"] == "C1"
+    assert by_recipient["#b"].status == "failed"
+    assert by_recipient["#b"].message_id is None
+    assert by_recipient["#b"].error_message
+
+
+async def test_decision_updates_sent_review_messages_in_place(
+    session: AsyncSession, review: Review, connector
+):
+    """Deciding edits the review messages that were delivered, and only those."""
+    config, fake = connector
+    manager = ConnectorManager(session)
+    manager.routing_engine = FixedRoutes(config, ["#a", "#b"])
+    await manager.send_review_notification(review)
+
+    decision = Decision(review_id=review.id, decision_type=DecisionType.APPROVE.value)
+    session.add(decision)
+    await session.flush()
+    await manager.send_decision_notification(review, decision)
+
+    assert fake.updates == [("1.1", "C1")]
+
+    result = await session.execute(
+        select(NotificationLog).where(NotificationLog.review_id == review.id)
+    )
+    decision_logs = [
+        log for log in result.scalars()
+        if "decision_type" in (log.notification_metadata or {})
+    ]
+    assert {log.recipient: log.status for log in decision_logs} == {"#a": "sent", "#b": "failed"}
@@ -0,0 +1,65 @@
+"""Tests for attachment content validation."""
+import hashlib
+import io
+
+import pytest
+
+from humancheck.core.security.content_validator import validate_file, validate_stream
+
+PNG_DATA = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1024, 1024 * 1024])
+def test_validate_stream_matches_validate_file(chunk_size: int):
+    """Streaming validation reaches the same verdict and checksum at any chunk size."""
+    ok, error, metadata = validate_stream(
+        io.BytesIO(PNG_DATA), "image/png", "image", chunk_size=chunk_size
+    )
+
+    assert (ok, error, metadata) == validate_file(PNG_DATA, "image/png", "image")
+    assert metadata["checksum"] == hashlib.sha256(PNG_DATA).hexdigest()
+    assert metadata["validated_size"] == len(PNG_DATA)
+
+
+def test_validate_stream_finds_marker_split_across_chunks():
+    """A marker straddling a chunk boundary is still detected."""
+    chunk_size = 64
+    # "<scr" ends the first chunk and "ipt>" starts the second
+    data = b"\x89PNG" + b"\0" * (chunk_size - 4 - 4) + b"<script>alert(1)</script>"
+
+    ok, error, _ = validate_stream(io.BytesIO(data), "image/png", "image", chunk_size=chunk_size)
+
+    assert not ok
+    assert "Script content in image" in error
+
+
+def test_validate_stream_reads_from_current_position():
+    """Only the bytes after the file's current position are validated."""
+    file = io.BytesIO(b"MZ" + PNG_DATA)
+    file.seek(2)
+
+    ok, _, metadata = validate_stream(file, "image/png", "image")
+
+    assert ok
+    assert metadata["checksum"] == hashlib.sha256(PNG_DATA).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "data, content_type, max_size, expected_error",
+    [
+        (b"MZ\x90\x00", "application/pdf", None, "Executable file detected"),
+        (b"%PDF-1.7 /JavaScript", "application/pdf", None, "JavaScript"),
+        (b"too long", "text/plain", 4, "File too large"),
+        (b"", "text/plain", None, "File is empty"),
+        (b"data", "application/x-msdownload", None, "not allowed"),
+    ],
+)
+def test_validate_stream_rejects(data, content_type, max_size, expected_error):
+    """Streaming validation rejects the same files validate_file does."""
+    category = "text" if content_type == "text/plain" else "document"
+
+    ok, error, metadata = validate_stream(io.BytesIO(data), content_type, category, max_size)
+
+    assert not ok
+    assert expected_error in error
+    assert metadata == {}
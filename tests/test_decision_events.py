@@ -0,0 +1,50 @@
+"""Tests for in-process decision signalling."""
+import asyncio
+
+from humancheck.core.adapters import decision_events
+from humancheck.core.adapters.decision_events import (
+    add_decision_listener,
+    notify_decision,
+    wait_for_decision,
+)
+
+
+async def test_notify_wakes_every_waiter():
+    """All requests blocked on a review wake on its decision and clean up after."""
+    waiters = [asyncio.create_task(wait_for_decision(1, timeout=30)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    notify_decision(1)
+
+    assert await asyncio.wait_for(asyncio.gather(*waiters), timeout=1) == [True] * 3
+    assert 1 not in decision_events._events
+    assert 1 not in decision_events._waiter_counts
+
+
+async def test_wait_times_out_without_a_decision():
+    """A waiter with no decision returns False after its timeout, leaving nothing behind."""
+    assert await wait_for_decision(2, timeout=0.01) is False
+    assert 2 not in decision_events._events
+    assert 2 not in decision_events._waiter_counts
+
+
+async def test_notify_only_wakes_that_review():
+    """A decision on one review doesn't wake waiters on another."""
+    other = asyncio.create_task(wait_for_decision(3, timeout=0.05))
+    await asyncio.sleep(0)
+
+    notify_decision(4)
+
+    assert await other is False
+
+
+async def test_notify_runs_listeners(monkeypatch):
+    """Listeners get the decided review's ID, even with nothing waiting."""
+    monkeypatch.setattr(decision_events, "_listeners", [])
+    decided = []
+    add_decision_listener(decided.append)
+    add_decision_listener(decided.append)  # registering twice is a no-op
+
+    notify_decision(5)
+
+    assert decided == [5]
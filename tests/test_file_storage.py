@@ -0,0 +1,68 @@
+"""Tests for the local filesystem storage provider."""
+import hashlib
+import io
+
+import pytest
+
+from humancheck.core.file_storage import local
+from humancheck.core.file_storage.local import LocalStorageProvider
+
+
+class FailingReader(io.BytesIO):
+    """File whose read fails after the first chunk, like a dropped upload."""
+
+    def read(self, size=-1):
+        if self.tell():
+            raise OSError("connection reset")
+        return super().read(size)
+
+
+@pytest.fixture
+def storage(tmp_path) -> LocalStorageProvider:
+    """Create a storage provider rooted in a temporary directory."""
+    return LocalStorageProvider(base_path=str(tmp_path))
+
+
+async def test_upload_writes_file_and_metadata(storage: LocalStorageProvider):
+    """An upload stores the content and records its size and checksum."""
+    data = b"hello world" * 1000
+
+    await storage.upload(io.BytesIO(data), "reviews/1/note.txt", "text/plain", {"review_id": 1})
+
+    assert await storage.download("reviews/1/note.txt") == data
+    assert await storage.get_metadata("reviews/1/note.txt") == {
+        "content_type": "text/plain",
+        "size": len(data),
+        "checksum": hashlib.sha256(data).hexdigest(),
+        "review_id": 1,
+    }
+
+
+async def test_failed_upload_keeps_previous_file(
+    monkeypatch, tmp_path, storage: LocalStorageProvider
+):
+    """A write that fails midway leaves the old file intact and no temporary files."""
+    await storage.upload(io.BytesIO(b"original"), "doc.txt", "text/plain")
+    monkeypatch.setattr(local, "CHUNK_SIZE", 4)
+
+    with pytest.raises(OSError):
+        await storage.upload(FailingReader(b"replacement"), "doc.txt", "text/plain")
+
+    assert await storage.download("doc.txt") == b"original"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["doc.txt", "doc.txt.meta"]
+
+
+async def test_upload_keeps_default_file_permissions(tmp_path, storage: LocalStorageProvider):
+    """Atomically written files get the permissions open() would have given them."""
+    await storage.upload(io.BytesIO(b"data"), "doc.txt", "text/plain")
+    (tmp_path / "plain.txt").write_bytes(b"data")
+
+    mode = (tmp_path / "doc.txt").stat().st_mode & 0o777
+    assert mode == (tmp_path / "plain.txt").stat().st_mode & 0o777
+
+
+@pytest.mark.parametrize("key", ["../escape.txt", "/etc/passwd", "a/../../b", "bad key"])
+async def test_rejects_unsafe_keys(storage: LocalStorageProvider, key: str):
+    """Keys that are absolute, escape the storage directory or have odd characters fail."""
+    with pytest.raises(ValueError):
+        await storage.upload(io.BytesIO(b"data"), key, "text/plain")
@@ -0,0 +1,29 @@
+"""Tests for MCP tool call dispatch."""
+import json
+
+from humancheck import mcp_server
+
+
+async def test_call_tool_ignores_unknown_arguments(monkeypatch):
+    """Extra keys from the client are dropped instead of failing the call."""
+    calls = []
+
+    async def check_review_status(review_id: int):
+        calls.append(review_id)
+        return {"review_id": review_id, "status": "pending"}
+
+    monkeypatch.setitem(mcp_server._TOOL_HANDLERS, "check_review_status", check_review_status)
+
+    [content] = await mcp_server.call_tool(
+        "check_review_status", {"review_id": 7, "trace_id": "abc"}
+    )
+
+    assert calls == [7]
+    assert json.loads(content.text) == {"review_id": 7, "status": "pending"}
+
+
+async def test_call_tool_reports_missing_required_argument():
+    """A missing required argument is reported to the client as an error."""
+    [content] = await mcp_server.call_tool("check_review_status", {"trace_id": "abc"})
+
+    assert content.text.startswith("Error:")
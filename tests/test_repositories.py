@@ -1,6 +1,12 @@
 """Tests for repository pattern implementations."""
+import zlib
+from types import MappingProxyType
+from typing import Optional
+
 import pytest
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from humancheck.core.models import (
     Review,
@@ -13,7 +19,6 @@ from humancheck.core.models import (
     UrgencyLevel,
     ContentCategory,
 )
-from humancheck.core.storage.database import Database, init_db
 from humancheck.core.storage.repositories import (
     ReviewRepository,
     DecisionRepository,
@@ -21,25 +26,6 @@ from humancheck.core.storage.repositories import (
     AssignmentRepository,
     AttachmentRepository,
 )
-from humancheck.core.config.settings import init_config
-
-
-@pytest.fixture
-async def db():
-    """Create test database."""
-    config = init_config()
-    config.db_path = ":memory:"
-    db = init_db(config.get_database_url())
-    await db.create_tables()
-    yield db
-    await db.close()
-
-
-@pytest.fixture
-async def session(db: Database):
-    """Create test session."""
-    async with db.session() as session:
-        yield session
 
 
 @pytest.fixture
@@ -48,313 +34,255 @@ async def review_repo(session: AsyncSession):
     return ReviewRepository(session)
 
 
-@pytest.fixture
-async def decision_repo(session: AsyncSession):
-    """Create decision repository."""
-    return DecisionRepository(session)
+# Fields for a pending, medium-urgency review
+BASE_REVIEW = MappingProxyType({
+    "task_type": "test",
+    "proposed_action": "Test action",
+    "urgency": UrgencyLevel.MEDIUM.value,
+    "status": ReviewStatus.PENDING.value,
+})
 
 
-@pytest.fixture
-async def feedback_repo(session: AsyncSession):
-    """Create feedback repository."""
-    return FeedbackRepository(session)
+def _review(**overrides) -> Review:
+    """Build a pending, medium-urgency review, with any field overridden."""
+    return Review(**{**BASE_REVIEW, **overrides})
+
+
+def _attachment(review_id: int, storage_key: str = "test/key") -> Attachment:
+    """Build a small text attachment for a review."""
+    return Attachment(
+        review_id=review_id,
+        file_name="test.txt",
+        content_type="text/plain",
+        content_category=ContentCategory.TEXT.value,
+        file_size=100,
+        storage_key=storage_key,
+        storage_provider="local",
+    )
 
 
 @pytest.fixture
-async def assignment_repo(session: AsyncSession):
-    """Create assignment repository."""
-    return AssignmentRepository(session)
+def sample_review() -> Review:
+    """Create an unsaved sample review."""
+    return _review()
 
 
 @pytest.fixture
-async def attachment_repo(session: AsyncSession):
-    """Create attachment repository."""
-    return AttachmentRepository(session)
+async def created_review(review_repo: ReviewRepository, sample_review: Review):
+    """Create a saved sample review."""
+    return await review_repo.create(sample_review)
 
 
-@pytest.mark.asyncio
-async def test_review_repository_create(review_repo: ReviewRepository):
+@pytest.fixture
+async def seeded_review(session: AsyncSession, sample_review: Review):
+    """Create a review with a decision, feedback and an attachment linked by review_id.
+
+    The review is expunged afterwards, so fetching it loads its relationships from the
+    database rather than returning the objects built here.
+    """
+    session.add(sample_review)
+    await session.flush()
+
+    session.add_all([
+        Decision(review_id=sample_review.id, decision_type=DecisionType.APPROVE.value),
+        Feedback(review_id=sample_review.id, rating=5),
+        _attachment(sample_review.id),
+    ])
+    await session.flush()
+    session.expunge(sample_review)
+    return sample_review
+
+
+async def test_review_repository_create(created_review: Review):
     """Test creating a review."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    
-    created = await review_repo.create(review)
+    assert created_review.id is not None
+    assert created_review.task_type == "test"
+    assert created_review.status == ReviewStatus.PENDING.value
+
+
+async def _first_feedback(repo: FeedbackRepository, feedback: Feedback) -> Optional[Feedback]:
+    """Fetch the first feedback for the same review as another feedback."""
+    feedbacks = await repo.get_by_review_id(feedback.review_id)
+    return feedbacks[0] if feedbacks else None
+
+
+@pytest.mark.parametrize(
+    "repo_cls, build, field, expected, lookup",
+    [
+        (
+            DecisionRepository,
+            lambda review_id: Decision(
+                review_id=review_id,
+                decision_type=DecisionType.APPROVE.value,
+                notes="Test notes",
+            ),
+            "decision_type",
+            DecisionType.APPROVE.value,
+            lambda repo, decision: repo.get_by_review_id(decision.review_id),
+        ),
+        (
+            FeedbackRepository,
+            lambda review_id: Feedback(review_id=review_id, rating=5, comment="Great!"),
+            "rating",
+            5,
+            _first_feedback,
+        ),
+        (
+            AssignmentRepository,
+            lambda review_id: ReviewAssignment(
+                review_id=review_id,
+                reviewer_identifier="test@example.com",
+            ),
+            "reviewer_identifier",
+            "test@example.com",
+            None,
+        ),
+        (
+            AttachmentRepository,
+            lambda review_id: _attachment(review_id, storage_key="unique/key"),
+            "storage_key",
+            "unique/key",
+            lambda repo, attachment: repo.get_by_storage_key(attachment.storage_key),
+        ),
+    ],
+    ids=["decision", "feedback", "assignment", "attachment"],
+)
+async def test_repository_roundtrip(
+    session: AsyncSession, created_review: Review, repo_cls, build, field, expected, lookup
+):
+    """Test creating a review's related record, then fetching it back by its lookup key."""
+    repo = repo_cls(session)
+
+    created = await repo.create(build(created_review.id))
     assert created.id is not None
-    assert created.task_type == "test"
-    assert created.status == ReviewStatus.PENDING.value
+    assert getattr(created, field) == expected
 
+    if lookup is not None:
+        retrieved = await lookup(repo, created)
+        assert retrieved is not None
+        assert retrieved.review_id == created_review.id
+        assert getattr(retrieved, field) == expected
 
-@pytest.mark.asyncio
-async def test_review_repository_get(review_repo: ReviewRepository):
+
+async def test_review_repository_get(review_repo: ReviewRepository, created_review: Review):
     """Test getting a review by ID."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created = await review_repo.create(review)
-    
-    retrieved = await review_repo.get(created.id)
+    retrieved = await review_repo.get(created_review.id)
     assert retrieved is not None
-    assert retrieved.id == created.id
+    assert retrieved.id == created_review.id
     assert retrieved.task_type == "test"
 
 
-@pytest.mark.asyncio
-async def test_review_repository_update(review_repo: ReviewRepository):
+async def test_review_repository_update(review_repo: ReviewRepository, created_review: Review):
     """Test updating a review."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created = await review_repo.create(review)
-    
-    updated = await review_repo.update(created.id, status=ReviewStatus.APPROVED.value)
+    updated = await review_repo.update(created_review.id, status=ReviewStatus.APPROVED.value)
     assert updated is not None
     assert updated.status == ReviewStatus.APPROVED.value
 
 
-@pytest.mark.asyncio
-async def test_review_repository_list(review_repo: ReviewRepository):
-    """Test listing reviews."""
-    # Create multiple reviews
-    for i in range(3):
-        review = Review(
-            task_type=f"test_{i}",
-            proposed_action=f"Test action {i}",
-            urgency=UrgencyLevel.MEDIUM.value,
-            status=ReviewStatus.PENDING.value,
-        )
-        await review_repo.create(review)
-    
-    reviews = await review_repo.list()
-    assert len(reviews) >= 3
-
-
-@pytest.mark.asyncio
-async def test_review_repository_list_by_status(review_repo: ReviewRepository):
-    """Test listing reviews by status."""
-    # Create reviews with different statuses
-    for status in [ReviewStatus.PENDING, ReviewStatus.APPROVED]:
-        review = Review(
-            task_type="test",
-            proposed_action="Test action",
-            urgency=UrgencyLevel.MEDIUM.value,
-            status=status.value,
-        )
-        await review_repo.create(review)
-    
-    pending = await review_repo.list_by_status(ReviewStatus.PENDING)
-    assert len(pending) >= 1
-    assert all(r.status == ReviewStatus.PENDING.value for r in pending)
-
-
-@pytest.mark.asyncio
-async def test_review_repository_get_with_relationships(review_repo: ReviewRepository, decision_repo: DecisionRepository):
+@pytest.mark.parametrize("status", [None, ReviewStatus.PENDING], ids=["all", "pending"])
+async def test_review_repository_list(review_repo: ReviewRepository, status):
+    """Test listing reviews, optionally filtered by status."""
+    for review_status in [ReviewStatus.PENDING, ReviewStatus.APPROVED]:
+        await review_repo.create(_review(status=review_status.value))
+
+    if status is None:
+        reviews = await review_repo.list()
+        assert len(reviews) >= 2
+    else:
+        reviews = await review_repo.list_by_status(status)
+        assert len(reviews) >= 1
+        assert all(r.status == status.value for r in reviews)
+
+
+async def test_review_repository_get_with_relationships(
+    review_repo: ReviewRepository, seeded_review: Review
+):
     """Test getting review with relationships."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created_review = await review_repo.create(review)
-    
-    decision = Decision(
-        review_id=created_review.id,
-        decision_type=DecisionType.APPROVE.value,
-    )
-    await decision_repo.create(decision)
-    
-    review_with_decision = await review_repo.get_with_relationships(created_review.id)
+    review_with_decision = await review_repo.get_with_relationships(seeded_review.id)
     assert review_with_decision is not None
     assert review_with_decision.decision is not None
     assert review_with_decision.decision.decision_type == DecisionType.APPROVE.value
 
 
-@pytest.mark.asyncio
-async def test_review_repository_delete(review_repo: ReviewRepository):
+async def test_review_repository_delete(review_repo: ReviewRepository, created_review: Review):
     """Test deleting a review."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created = await review_repo.create(review)
-    
-    deleted = await review_repo.delete(created.id)
+    deleted = await review_repo.delete(created_review.id)
     assert deleted is True
-    
-    retrieved = await review_repo.get(created.id)
-    assert retrieved is None
 
+    retrieved = await review_repo.get(created_review.id)
+    assert retrieved is None
 
-@pytest.mark.asyncio
-async def test_decision_repository_create(decision_repo: DecisionRepository, review_repo: ReviewRepository):
-    """Test creating a decision."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created_review = await review_repo.create(review)
-    
-    decision = Decision(
-        review_id=created_review.id,
-        decision_type=DecisionType.APPROVE.value,
-        notes="Test notes",
-    )
-    
-    created = await decision_repo.create(decision)
-    assert created.id is not None
-    assert created.decision_type == DecisionType.APPROVE.value
 
+async def test_attachment_inline_content_is_stored_compressed(
+    session: AsyncSession, created_review: Review
+):
+    """Inline text is zlib-compressed on disk and read back unchanged."""
+    content = "Line of attachment text, repeated. ✓\n" * 200
+    attachment = _attachment(created_review.id)
+    attachment.inline_content = content
+    session.add(attachment)
+    await session.flush()
+    session.expunge(attachment)
 
-@pytest.mark.asyncio
-async def test_decision_repository_get_by_review_id(decision_repo: DecisionRepository, review_repo: ReviewRepository):
-    """Test getting decision by review ID."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created_review = await review_repo.create(review)
-    
-    decision = Decision(
-        review_id=created_review.id,
-        decision_type=DecisionType.APPROVE.value,
+    stored = await session.scalar(
+        text("SELECT inline_content FROM attachments WHERE id = :id"), {"id": attachment.id}
     )
-    await decision_repo.create(decision)
-    
-    retrieved = await decision_repo.get_by_review_id(created_review.id)
-    assert retrieved is not None
-    assert retrieved.review_id == created_review.id
-
+    assert len(stored) < len(content.encode())
+    assert zlib.decompress(stored).decode() == content
 
-@pytest.mark.asyncio
-async def test_feedback_repository_create(feedback_repo: FeedbackRepository, review_repo: ReviewRepository):
-    """Test creating feedback."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
+    reloaded = await session.scalar(
+        select(Attachment).options(undefer_group("large")).where(Attachment.id == attachment.id)
     )
-    created_review = await review_repo.create(review)
-    
-    feedback = Feedback(
-        review_id=created_review.id,
-        rating=5,
-        comment="Great!",
+    assert reloaded.inline_content == content
+
+
+async def test_attachment_inline_content_reads_uncompressed_rows(
+    session: AsyncSession, created_review: Review
+):
+    """Inline text stored as plain text before compression is read back as is."""
+    attachment = _attachment(created_review.id)
+    session.add(attachment)
+    await session.flush()
+    session.expunge(attachment)
+    await session.execute(
+        text("UPDATE attachments SET inline_content = :content WHERE id = :id"),
+        {"content": "legacy text", "id": attachment.id},
     )
-    
-    created = await feedback_repo.create(feedback)
-    assert created.id is not None
-    assert created.rating == 5
-
 
-@pytest.mark.asyncio
-async def test_feedback_repository_get_by_review_id(feedback_repo: FeedbackRepository, review_repo: ReviewRepository):
-    """Test getting feedback by review ID."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created_review = await review_repo.create(review)
-    
-    feedback = Feedback(
-        review_id=created_review.id,
-        rating=5,
-    )
-    await feedback_repo.create(feedback)
-    
-    feedbacks = await feedback_repo.get_by_review_id(created_review.id)
-    assert len(feedbacks) >= 1
-    assert feedbacks[0].rating == 5
-
-
-@pytest.mark.asyncio
-async def test_assignment_repository_create(assignment_repo: AssignmentRepository, review_repo: ReviewRepository):
-    """Test creating an assignment."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
+    reloaded = await session.scalar(
+        select(Attachment).options(undefer_group("large")).where(Attachment.id == attachment.id)
     )
-    created_review = await review_repo.create(review)
-    
-    assignment = ReviewAssignment(
-        review_id=created_review.id,
-        reviewer_identifier="test@example.com",
+    assert reloaded.inline_content == "legacy text"
+
+
+async def test_attachment_checksum_reads_hex_text_rows(
+    session: AsyncSession, created_review: Review
+):
+    """Checksums stored as hex text before the raw-bytes column are read back as is."""
+    checksum = "ab" * 32
+    attachment = _attachment(created_review.id)
+    session.add(attachment)
+    await session.flush()
+    session.expunge(attachment)
+    await session.execute(
+        text("UPDATE attachments SET checksum = :checksum WHERE id = :id"),
+        {"checksum": checksum, "id": attachment.id},
     )
-    
-    created = await assignment_repo.create(assignment)
-    assert created.id is not None
-    assert created.reviewer_identifier == "test@example.com"
 
+    reloaded = await session.get(Attachment, attachment.id)
+    assert reloaded.checksum == checksum
 
-@pytest.mark.asyncio
-async def test_attachment_repository_create(attachment_repo: AttachmentRepository, review_repo: ReviewRepository):
-    """Test creating an attachment."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created_review = await review_repo.create(review)
-    
-    attachment = Attachment(
-        review_id=created_review.id,
-        file_name="test.txt",
-        content_type="text/plain",
-        content_category=ContentCategory.TEXT.value,
-        file_size=100,
-        storage_key="test/key",
-        storage_provider="local",
-    )
-    
-    created = await attachment_repo.create(attachment)
-    assert created.id is not None
-    assert created.file_name == "test.txt"
 
+async def test_committed_rows_are_rolled_back_after_a_test(session: AsyncSession):
+    """Write a marker row and commit it; the next test checks it was rolled back."""
+    session.add(_review(task_type="isolation-marker"))
+    await session.commit()
+
+    assert await session.scalar(select(Review).where(Review.task_type == "isolation-marker"))
 
-@pytest.mark.asyncio
-async def test_attachment_repository_get_by_storage_key(attachment_repo: AttachmentRepository, review_repo: ReviewRepository):
-    """Test getting attachment by storage key."""
-    review = Review(
-        task_type="test",
-        proposed_action="Test action",
-        urgency=UrgencyLevel.MEDIUM.value,
-        status=ReviewStatus.PENDING.value,
-    )
-    created_review = await review_repo.create(review)
-    
-    attachment = Attachment(
-        review_id=created_review.id,
-        file_name="test.txt",
-        content_type="text/plain",
-        content_category=ContentCategory.TEXT.value,
-        file_size=100,
-        storage_key="unique/key",
-        storage_provider="local",
-    )
-    await attachment_repo.create(attachment)
-    
-    retrieved = await attachment_repo.get_by_storage_key("unique/key")
-    assert retrieved is not None
-    assert retrieved.storage_key == "unique/key"
 
+async def test_rows_from_previous_test_are_gone(session: AsyncSession):
+    """Rows committed in the previous test don't leak into this one."""
+    assert await session.scalar(
+        select(Review).where(Review.task_type == "isolation-marker")
+    ) is None
@@ -0,0 +1,175 @@
+"""Tests for routing rule evaluation and review assignment."""
+import re
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from humancheck.core.models import Review, ReviewAssignment
+from humancheck.core.routing.engine import RoutingEngine
+from humancheck.core.routing.evaluator import ConditionEvaluator
+
+
+@pytest.fixture
+def evaluator() -> ConditionEvaluator:
+    """Create a condition evaluator."""
+    return ConditionEvaluator()
+
+
+@pytest.mark.parametrize("pattern", ["[unclosed", None, 42])
+def test_invalid_pattern_compiles_and_fails_when_evaluated(
+    evaluator: ConditionEvaluator, pattern
+):
+    """A bad regex doesn't break compiling the rule set; it fails like evaluate() does."""
+    conditions = {"task_type": {"operator": "matches", "value": pattern}}
+
+    predicate = evaluator.compile(conditions)
+
+    assert predicate({"task_type": None}) is False
+    with pytest.raises((re.error, TypeError)):
+        predicate({"task_type": "payment"})
+    with pytest.raises((re.error, TypeError)):
+        evaluator.evaluate(conditions, {"task_type": "payment"})
+
+
+def test_compiled_predicate_matches_evaluate(evaluator: ConditionEvaluator):
+    """Compiled conditions agree with the interpreted evaluator."""
+    conditions = {
+        "and": [
+            {"task_type": {"operator": "matches", "value": "pay.*"}},
+            {"metadata.amount": {"operator": ">", "value": 100}},
+        ]
+    }
+    predicate = evaluator.compile(conditions)
+
+    for data in (
+        {"task_type": "payment", "metadata": {"amount": 500}},
+        {"task_type": "payment", "metadata": {"amount": 50}},
+        {"task_type": "refund", "metadata": {"amount": 500}},
+    ):
+        assert predicate(data) == evaluator.evaluate(conditions, data)
+
+
+def test_selectivity_checks_most_selective_condition_first(evaluator: ConditionEvaluator):
+    """A rarely matching condition is checked first and rejects before the others run."""
+    conditions = {
+        "metadata.amount": {"operator": ">", "value": 100},
+        "urgency": {"operator": "=", "value": "high"},
+    }
+    data = {"urgency": "low", "metadata": {"amount": "unknown"}}
+
+    # In config order the amount comparison raises; checked first, urgency rejects
+    with pytest.raises(TypeError):
+        evaluator.compile(conditions)(data)
+    assert evaluator.compile(conditions, {"urgency": 0.05})(data) is False
+
+
+def test_selectivity_keeps_invalid_conditions_in_place(evaluator: ConditionEvaluator):
+    """Reordering never skips a condition whose spec is invalid."""
+    conditions = {
+        "task_type": {"operator": "bogus", "value": "payment"},
+        "urgency": {"operator": "=", "value": "high"},
+    }
+    predicate = evaluator.compile(conditions, {"urgency": 0.05})
+
+    with pytest.raises(ValueError):
+        predicate({"task_type": "payment", "urgency": "low"})
+
+
+@pytest.fixture
+def engine() -> RoutingEngine:
+    """Create a routing engine with one payment rule and a default reviewer."""
+    engine = RoutingEngine()
+    engine.config = SimpleNamespace(
+        routing_rules=[
+            {
+                "conditions": {"task_type": {"operator": "=", "value": "payment"}},
+                "assign_to_team": "finance",
+            }
+        ],
+        default_reviewers=["admin@example.com"],
+    )
+    return engine
+
+
+async def test_route_reviews_bulk_creates_one_assignment_per_review(
+    session: AsyncSession, engine: RoutingEngine
+):
+    """Bulk routing applies the rules to each review and writes every assignment."""
+    reviews = [
+        Review(task_type=task_type, proposed_action="Test action", urgency="medium")
+        for task_type in ("payment", "refund", "payment")
+    ]
+    session.add_all(reviews)
+    await session.flush()
+
+    ids = await engine.route_reviews_bulk(reviews, session)
+
+    result = await session.execute(
+        select(ReviewAssignment).where(ReviewAssignment.id.in_(ids))
+    )
+    assigned = {
+        a.review_id: (a.team_name, a.reviewer_identifier) for a in result.scalars()
+    }
+    assert assigned == {
+        reviews[0].id: ("finance", None),
+        reviews[1].id: (None, "admin@example.com"),
+        reviews[2].id: ("finance", None),
+    }
+
+
+async def test_route_reviews_bulk_without_assignments(session: AsyncSession, engine: RoutingEngine):
+    """Nothing is written when no rule or default reviewer applies."""
+    engine.config.default_reviewers = []
+    review = Review(task_type="refund", proposed_action="Test action", urgency="medium")
+    session.add(review)
+    await session.flush()
+
+    assert await engine.route_reviews_bulk([review], session) == []
+
+
+def test_compiled_rules_are_shared_until_the_rules_change(engine: RoutingEngine, monkeypatch):
+    """Engines reuse one compilation per rules object and recompile when it's replaced."""
+    compiled = []
+    compile_rule = ConditionEvaluator.compile
+
+    def counting_compile(self, conditions, selectivity=None):
+        compiled.append(conditions)
+        return compile_rule(self, conditions, selectivity)
+
+    monkeypatch.setattr(ConditionEvaluator, "compile", counting_compile)
+    monkeypatch.setattr(RoutingEngine, "_compiled_cache", None)
+
+    assert engine.warmup() == 1
+    other = RoutingEngine()
+    other.config = engine.config
+    assert other.warmup() == 1
+    assert len(compiled) == 1
+
+    engine.config.routing_rules = [
+        *engine.config.routing_rules,
+        {"conditions": {"urgency": "critical"}, "assign_to": "oncall@example.com"},
+        {"conditions": {"urgency": "low"}, "is_active": False},
+    ]
+    assert engine.warmup() == 2
+    assert len(compiled) == 3
+
+
+def test_candidate_rules_are_indexed_by_task_type(engine: RoutingEngine):
+    """Rules gated on another task type are skipped; ungated rules apply to every type."""
+    engine.config.routing_rules = [
+        {"conditions": {"task_type": {"operator": "in", "value": ["payment", "refund"]}},
+         "assign_to_team": "finance"},
+        {"conditions": {"urgency": "critical"}, "assign_to": "oncall@example.com"},
+    ]
+
+    def assignees(task_type: str) -> list:
+        return [
+            team or reviewer
+            for _, reviewer, team in engine._get_candidate_rules(task_type)
+        ]
+
+    assert assignees("payment") == ["finance", "oncall@example.com"]
+    assert assignees("refund") == ["finance", "oncall@example.com"]
+    assert assignees("support") == ["oncall@example.com"]
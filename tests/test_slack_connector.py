@@ -0,0 +1,154 @@
+"""Tests for the Slack connector's send worker lifecycle."""
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from humancheck.core.integrations import manager
+from humancheck.core.integrations.manager import (
+    _cache_connector,
+    _connector_instances,
+    _get_cached_connector,
+    close_connectors,
+)
+from humancheck.core.integrations.slack.client import SlackConnector, close_shared_session
+from humancheck.core.models import Review
+
+
+@pytest.fixture(autouse=True)
+async def shared_session():
+    """Close the HTTP session connectors share once each test is done with it."""
+    yield
+    await close_shared_session()
+
+
+@pytest.fixture
+def connector(monkeypatch) -> SlackConnector:
+    """Create a Slack connector whose API calls succeed without the network."""
+    connector = SlackConnector({"bot_token": "xoxb-test"})
+
+    async def post_message(**kwargs):
+        return {"ok": True, "ts": "1.1", "channel": kwargs["channel"]}
+
+    monkeypatch.setattr(connector.client, "chat_postMessage", post_message)
+    return connector
+
+
+async def _post(connector: SlackConnector) -> dict:
+    future = await connector._enqueue(lambda: connector.client.chat_postMessage(channel="C1"))
+    return await future
+
+
+async def test_aclose_stops_send_worker(connector: SlackConnector):
+    """Closing the connector cancels its worker; the next send starts a new one."""
+    assert (await _post(connector))["ts"] == "1.1"
+    worker = connector._worker
+
+    await connector.aclose()
+
+    assert worker.cancelled()
+    assert connector._worker is None
+
+    assert (await _post(connector))["ts"] == "1.1"
+    assert connector._worker is not worker
+    await connector.aclose()
+
+
+def test_send_worker_follows_the_running_loop(connector: SlackConnector):
+    """A connector reused from another event loop doesn't send through a stale worker."""
+    first, second = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first.run_until_complete(_post(connector))
+        stale = connector._worker
+        stale_session = connector.client.session
+
+        assert second.run_until_complete(_post(connector))["ts"] == "1.1"
+        assert connector._worker is not stale
+        assert connector._worker.get_loop() is second
+
+        # The stale worker was cancelled on its own loop
+        first.run_until_complete(asyncio.sleep(0))
+        assert stale.cancelled()
+
+        second.run_until_complete(connector.aclose())
+        second.run_until_complete(close_shared_session())
+        first.run_until_complete(stale_session.close())
+    finally:
+        first.close()
+        second.close()
+
+
+async def test_close_connectors_closes_cached_instances(connector: SlackConnector):
+    """Shutdown closes every cached connector and empties the cache."""
+    await _post(connector)
+    worker = connector._worker
+    _cache_connector(-1, connector)
+
+    await close_connectors()
+
+    assert worker.cancelled()
+    assert not _connector_instances
+
+
+async def test_evicted_and_expired_connectors_are_closed(monkeypatch, connector: SlackConnector):
+    """Connectors dropped from the cache, by size or by age, get their worker stopped."""
+    monkeypatch.setattr(manager, "CONNECTOR_CACHE_SIZE", 1)
+    await _post(connector)
+    evicted_worker = connector._worker
+    _cache_connector(-1, connector)
+
+    other = SlackConnector({"bot_token": "xoxb-test"})
+    other.client.chat_postMessage = connector.client.chat_postMessage
+    await _post(other)
+    expired_worker = other._worker
+    _cache_connector(-2, other)
+
+    monkeypatch.setattr(manager, "CONNECTOR_CACHE_TTL", 0.0)
+    _cache_connector(-2, other)
+    assert _get_cached_connector(-2) is None
+
+    await close_connectors()
+    assert evicted_worker.cancelled()
+    assert expired_worker.cancelled()
+
+
+def test_review_blocks_are_not_shared_between_messages(connector: SlackConnector):
+    """Editing one message's blocks doesn't leak into the next message."""
+    review = Review(id=1, task_type="test", proposed_action="Test action", urgency="high")
+
+    blocks = connector._build_review_blocks(review)
+    blocks[0]["text"]["text"] = "edited"
+
+    assert connector._build_review_blocks(review)[0]["text"]["text"].endswith("New Review Request")
+
+
+def test_http_session_follows_the_running_loop():
+    """A connector keeps working when a later event loop (e.g. asyncio.run) uses it."""
+    connector = SlackConnector({"bot_token": "xoxb-test"})
+
+    async def auth_test(request):
+        return web.json_response({"ok": True, "team": "T", "user": "U", "bot_id": "B"})
+
+    async def check_connection(close_session: bool):
+        app = web.Application()
+        app.router.add_post("/auth.test", auth_test)
+        async with TestServer(app) as server:
+            connector.client.base_url = str(server.make_url("/"))
+            result = await connector.test_connection()
+        assert connector.client.session._loop is asyncio.get_running_loop()
+        if close_session:
+            await close_shared_session()
+        return result
+
+    first, second = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        # The first loop's session is left open, as it is when a loop is simply abandoned
+        assert first.run_until_complete(check_connection(close_session=False))["success"]
+        stale_session = connector.client.session
+        assert second.run_until_complete(check_connection(close_session=True))["success"]
+        assert connector.client.session is not stale_session
+        first.run_until_complete(stale_session.close())
+    finally:
+        first.close()
+        second.close()
@@ -0,0 +1,186 @@
+"""Tests for the MCP tool functions."""
+import importlib
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from humancheck.core.adapters import McpAdapter
+from humancheck.core.adapters.decision_events import notify_decision
+from humancheck.core.models import Decision, DecisionType, Review, ReviewAssignment, ReviewStatus
+from humancheck.core.routing import engine as routing_engine_module
+from humancheck.tools.get_decision import get_review_decision, invalidate_decision_cache
+from humancheck.tools.request_review import request_review, request_reviews_bulk
+
+# humancheck.tools re-exports functions under their modules' names, so look the modules up
+TOOL_MODULES = [
+    importlib.import_module("humancheck.tools.get_decision"),
+    importlib.import_module("humancheck.tools.request_review"),
+]
+
+
+class SessionDatabase:
+    """Database stand-in whose sessions are the rolled-back test session."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self.opened = 0
+
+    @asynccontextmanager
+    async def session(self):
+        self.opened += 1
+        yield self._session
+
+
+@pytest.fixture
+def tool_db(monkeypatch, session: AsyncSession) -> SessionDatabase:
+    """Point the tools at the test session, starting from an empty decision cache."""
+    db = SessionDatabase(session)
+    for module in TOOL_MODULES:
+        monkeypatch.setattr(module, "get_db", lambda: db)
+    invalidate_decision_cache()
+    yield db
+    invalidate_decision_cache()
+
+
+@pytest.fixture
+async def decided_review(session: AsyncSession) -> Review:
+    """Create an approved review with its decision."""
+    review = Review(
+        task_type="payment",
+        proposed_action="Process payment of $5,000",
+        urgency="high",
+        status=ReviewStatus.APPROVED.value,
+        meta_data={"organization_id": 1, "agent_id": 2},
+        decision=Decision(decision_type=DecisionType.APPROVE.value),
+    )
+    session.add(review)
+    await session.flush()
+    return review
+
+
+async def test_get_review_decision_is_served_from_cache(
+    tool_db: SessionDatabase, decided_review: Review
+):
+    """A decided review's response is cached, so polling again skips the database."""
+    first = await get_review_decision(decided_review.id)
+    assert first["review_id"] == decided_review.id
+    assert first["result"] == "approved"
+
+    second = await get_review_decision(decided_review.id)
+
+    assert second == first
+    assert tool_db.opened == 1
+
+
+async def test_decision_invalidates_cached_response(
+    tool_db: SessionDatabase, decided_review: Review
+):
+    """A decision made in this process drops the review's cached response."""
+    await get_review_decision(decided_review.id)
+
+    notify_decision(decided_review.id)
+    await get_review_decision(decided_review.id)
+
+    assert tool_db.opened == 2
+
+
+async def test_pending_review_is_not_cached(tool_db: SessionDatabase, session: AsyncSession):
+    """Pending responses are looked up every time, since a decision can arrive any moment."""
+    review = Review(task_type="payment", proposed_action="Process payment", urgency="low")
+    session.add(review)
+    await session.flush()
+
+    assert (await get_review_decision(review.id))["status"] == "pending"
+    await get_review_decision(review.id)
+
+    assert tool_db.opened == 2
+
+
+async def test_request_reviews_bulk_creates_and_routes_every_review(
+    tool_db: SessionDatabase, session: AsyncSession
+):
+    """Each request becomes a pending, assigned review; results keep request order."""
+    results = await request_reviews_bulk([
+        {"task_type": "payment", "proposed_action": "Pay $10", "urgency": "high"},
+        {"task_type": "refund", "proposed_action": "Refund $5"},
+    ])
+
+    assert [(r["task_type"], r["urgency"], r["status"]) for r in results] == [
+        ("payment", "high", "pending"),
+        ("refund", "medium", "pending"),
+    ]
+    review_ids = [r["review_id"] for r in results]
+    assigned = await session.scalars(
+        select(ReviewAssignment.review_id).where(ReviewAssignment.review_id.in_(review_ids))
+    )
+    assert sorted(assigned) == sorted(review_ids)
+
+
+async def test_request_reviews_bulk_rejects_the_whole_batch(
+    tool_db: SessionDatabase, session: AsyncSession
+):
+    """One invalid request fails the call before any review is created."""
+    count = select(func.count()).select_from(Review)
+    before = await session.scalar(count)
+
+    with pytest.raises(ValueError):
+        await request_reviews_bulk([
+            {"task_type": "payment", "proposed_action": "Pay $10"},
+            {"task_type": "payment", "proposed_action": "Pay $20", "urgency": "whenever"},
+        ])
+
+    assert await session.scalar(count) == before
+    assert tool_db.opened == 0
+
+
+async def test_organization_and_agent_ids_round_trip(
+    monkeypatch, tool_db: SessionDatabase, session: AsyncSession
+):
+    """IDs given when requesting a review come back when its decision is read."""
+    requested = await request_review(
+        task_type="payment", proposed_action="Pay $10", organization_id=7, agent_id=9
+    )
+    [bulk_requested] = await request_reviews_bulk([
+        {"task_type": "payment", "proposed_action": "Pay $20", "organization_id": 8}
+    ])
+
+    seen = {}
+    from_universal = McpAdapter.from_universal
+
+    def capture(self, universal_review, decision):
+        seen[universal_review.proposed_action] = (
+            universal_review.organization_id, universal_review.agent_id
+        )
+        return from_universal(self, universal_review, decision)
+
+    monkeypatch.setattr(McpAdapter, "from_universal", capture)
+
+    for review_id in (requested["review_id"], bulk_requested["review_id"]):
+        review = await session.get(Review, review_id)
+        review.status = ReviewStatus.APPROVED.value
+        session.add(Decision(review_id=review_id, decision_type=DecisionType.APPROVE.value))
+    await session.flush()
+    session.expunge_all()
+
+    await get_review_decision(requested["review_id"])
+    await get_review_decision(bulk_requested["review_id"])
+
+    assert seen == {"Pay $10": (7, 9), "Pay $20": (8, None)}
+
+
+def test_routing_engine_is_shared_until_the_config_changes(monkeypatch):
+    """Requests reuse one routing engine and get a new one when the config is replaced."""
+    request_review_module = TOOL_MODULES[1]
+    engine = request_review_module._get_routing_engine()
+    assert request_review_module._get_routing_engine() is engine
+
+    new_config = SimpleNamespace(routing_rules=[], default_reviewers=[])
+    monkeypatch.setattr(request_review_module, "get_config", lambda: new_config)
+    monkeypatch.setattr(routing_engine_module, "get_config", lambda: new_config)
+
+    replaced = request_review_module._get_routing_engine()
+    assert replaced is not engine
+    assert replaced.config is new_config